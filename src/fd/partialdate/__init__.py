@@ -1 +1,16 @@
 # This directory is a Python package.
+
+
+def validate(text, kind=None):
+    """Determine what an ISO 8601 representation describes.
+
+    This is :func:`fd.partialdate.validation.validate`; `kind` defaults
+    to :class:`~fd.partialdate.datetime.Datetime`.
+
+    """
+    # The modules refer to this package by name as they are imported,
+    # so they cannot be imported until the package has been.
+    import fd.partialdate.validation
+    if kind is None:
+        return fd.partialdate.validation.validate(text)
+    return fd.partialdate.validation.validate(text, kind)
@@ -8,11 +8,14 @@ specified or omitted.
 
 """
 
+import bisect
 import datetime
 import functools
+import operator
 import typing
 
 import fd.partialdate.exceptions
+import fd.partialdate.precision
 import fd.partialdate.utils
 
 
@@ -31,6 +34,26 @@ _days_in_month = {
     12: 31,
 }
 
+
+def _days_before_months(isleap):
+    total = 0
+    result = [0]
+    for month in range(1, 13):
+        total += _days_in_month[month]
+        if month == 2 and not isleap:
+            total -= 1
+        result.append(total)
+    return tuple(result)
+
+
+# Number of days in the year before each month, indexed by leap year
+# status and then by month - 1; the final entry is the length of the
+# year.
+_days_before_month = (
+    _days_before_months(False),
+    _days_before_months(True),
+)
+
 _re_extended = r"""
     (?P<year>\d{4})
     (?:-
@@ -64,38 +87,300 @@ _re_basic_1 = r"""
      )?
     $
 """
+
+
+def _select(text):
+    # Only the last alternative allows a leading '-', and the first two
+    # require '-' following the year; the extended format has two.
+    if text[:1] == '-':
+        return (2,)
+    if text[4:5] != '-':
+        return (1, 2)
+    if text.count('-') > 1:
+        return (0,)
+    return (0, 1, 2)
+
+
 _rx = fd.partialdate.utils.RegularExpressionGroup(
     _re_extended,
     _re_basic_0,
     _re_basic_1,
+    names=('year', 'month', 'day', 'ordinal'),
+    select=_select,
 )
 
 
+def _match(text):
+    """Decode date fields using the regular expressions.
+
+    This is the reference implementation for :func:`_scan`; it returns
+    the same results, but is considerably slower.
+
+    """
+    found = _rx.match(text)
+    if found is None:
+        return None
+    alternative, (year, month, day, ordinal) = found
+    if alternative == 2:
+        # Only the last alternative allows '-' placeholders.
+        if ordinal is None:
+            if day is None and month == '-':
+                return None
+        elif year == '-':
+            return None
+        if year == '-':
+            year = None
+        if month == '-':
+            month = None
+    return tuple(
+        None if v is None else int(v)
+        for v in (year, month, day, ordinal)
+    )
+
+
+def _scanner(newline, dash, isdigits):
+    # Create a scanner for either str or bytes; the constants and the
+    # digit test must match the type of text to be scanned.
+
+    def _scan(text):
+        """Decode date fields from text without regular expressions.
+
+        Returns a tuple of year, month, day, and ordinal day, or
+        ``None`` if the text does not have the syntax of a supported
+        date format.  Range checks are left to the caller.
+
+        """
+        if text[-1:] == newline:
+            # The regular expressions accept a single trailing newline
+            # since ``$`` matches just before it; we need to do the same.
+            text = text[:-1]
+        n = len(text)
+        if text[:1] == dash:
+            # -MMDD, --DD; -MM and - are syntactically acceptable, but
+            # rejected when the date is constructed.
+            if n == 5:
+                if isdigits(text[1:]):
+                    return None, int(text[1:3]), int(text[3:]), None
+            elif n == 4:
+                if text[1:2] == dash and isdigits(text[2:]):
+                    return None, None, int(text[2:]), None
+            elif n == 3:
+                if isdigits(text[1:]):
+                    return None, int(text[1:]), None, None
+            elif n == 1:
+                return None, None, None, None
+        elif n == 10:
+            # YYYY-MM-DD
+            if (text[4:5] == dash and text[7:8] == dash
+                    and isdigits(text[:4]) and isdigits(text[5:7])
+                    and isdigits(text[8:])):
+                return int(text[:4]), int(text[5:7]), int(text[8:]), None
+        elif n == 8:
+            # YYYYMMDD, YYYY-DDD
+            if isdigits(text):
+                return int(text[:4]), int(text[4:6]), int(text[6:]), None
+            if (text[4:5] == dash and isdigits(text[:4])
+                    and isdigits(text[5:])):
+                return int(text[:4]), None, None, int(text[5:])
+        elif n == 7:
+            # YYYYDDD, YYYY-MM
+            if isdigits(text):
+                return int(text[:4]), None, None, int(text[4:])
+            if (text[4:5] == dash and isdigits(text[:4])
+                    and isdigits(text[5:])):
+                return int(text[:4]), int(text[5:]), None, None
+        elif n == 6:
+            # YYYYMM
+            if isdigits(text):
+                return int(text[:4]), int(text[4:]), None, None
+        elif n == 4:
+            # YYYY
+            if isdigits(text):
+                return int(text), None, None, None
+        return None
+
+    return _scan
+
+
+_scan = _scanner('\n', '-', str.isdecimal)
+_scan_bytes = _scanner(b'\n', b'-', bytes.isdigit)
+
+
+# The hand-written scanner is used by default; the regular expressions
+# are retained as a reference implementation, and may be selected by
+# assigning _match here.
+_parse_fields = _scan
+
+
+def _decode(text):
+    # Return the text, converted to bytes if not a str, and the decoded
+    # fields, or None if the text does not have a supported syntax.
+    if isinstance(text, str):
+        return text, _parse_fields(text)
+    text = fd.partialdate.utils.ascii_bytes(text)
+    return text, _scan_bytes(text)
+
+
 def _ordinal2md(what, text, year, ordinal):
     if year is None:
         raise fd.partialdate.exceptions.ParseError(what, text)
-    isleap = (year % 4) == 0
-    dims = sorted(_days_in_month.items())
-    remaining = ordinal
-    while dims:
-        month, dim = dims.pop(0)
-        if month == 2 and not isleap:
-            dim -= 1
-        if remaining <= dim:
-            day = remaining
-            break
-        remaining -= dim
-    else:
+    return _ordinal_month_day(year, ordinal)
+
+
+def _ordinal_month_day(year, ordinal):
+    """Convert an ordinal day to month and day for the given year.
+
+    An ordinal day of 0 results in a day of 0; that is left for
+    :func:`_check` to reject.
+
+    """
+    isleap = year % 4 == 0
+    days_before = _days_before_month[isleap]
+    month = bisect.bisect_left(days_before, ordinal, 1)
+    if month > 12:
         raise fd.partialdate.exceptions.RangeError(
             'ordinal day', ordinal, 1, 365 + isleap)
-    return month, day
+    return month, ordinal - days_before[month - 1]
+
 
+def _check(year, month, day):
+    """Raise ValueError if the fields do not describe a valid date."""
+    if year is None and day is None:
+        if month:
+            raise ValueError('must specify year or day along with month')
+        else:
+            raise ValueError('must specify year or day')
+    if year is not None:
+        if not (0 <= year <= 9999):
+            raise fd.partialdate.exceptions.RangeError(
+                'year', year, 0, 9999)
+    if month is None:
+        if year is not None and day is not None:
+            raise ValueError('cannot specify year and day without month')
+        if day is not None:
+            if not (1 <= day <= 31):
+                raise fd.partialdate.exceptions.RangeError(
+                    'day', day, 1, 31)
+    else:
+        if not (1 <= month <= 12):
+            raise fd.partialdate.exceptions.RangeError(
+                'month', month, 1, 12)
+        if day is not None:
+            dim = _days_in_month[month]
+            if year is not None and year % 4 and month == 2:
+                dim -= 1
+            if not (1 <= day <= dim):
+                raise fd.partialdate.exceptions.RangeError(
+                    'day', day, 1, dim)
 
-@functools.total_ordering
-class Date:
+
+def _valid(year, month, day):
+    """Return true if :func:`_check` accepts the fields.
+
+    Used when only validity is needed, so no exception is created.
+
+    """
+    if year is None:
+        if day is None:
+            return False
+    elif not (0 <= year <= 9999):
+        return False
+    if month is None:
+        if day is None:
+            return True
+        return year is None and 1 <= day <= 31
+    if not (1 <= month <= 12):
+        return False
+    if day is None:
+        return True
+    dim = _days_in_month[month]
+    if year is not None and year % 4 and month == 2:
+        dim -= 1
+    return 1 <= day <= dim
+
+
+def _valid_ordinal(year, ordinal):
+    """Return true if the ordinal day exists in the year."""
+    return 1 <= ordinal <= 365 + (year % 4 == 0)
+
+
+Precision = fd.partialdate.precision.Precision
+
+_precisions = fd.partialdate.precision.date_precisions
+_leading_fields = fd.partialdate.precision.leading_fields
+
+
+def _sort_key(year, month, day, leading=0):
+    """Pack date fields into an integer that orders like the fields.
+
+    Present fields are offset by one so that missing fields, encoded as
+    zero, order before all present values.  The position of the leading
+    field is placed in the most-significant bits.
+
+    """
+    return (
+        leading << 24
+        | (0 if year is None else year + 1) << 10
+        | (0 if month is None else month + 1) << 6
+        | (0 if day is None else day + 1)
+    )
+
+
+# The constructors build keys inline rather than calling _sort_key.
+# For complete dates, the key is year * 0x400 + _month_keys[month] + day;
+# the offsets of the year and day are folded into the month entries.
+_month_keys = tuple((month + 1) << 6 | 0x401 for month in range(13))
+
+_complete = _precisions[0b111]
+_new = object.__new__
+
+
+_d2 = fd.partialdate.utils.two_digits
+_d4 = fd.partialdate.utils.four_digits
+
+# Formatters indexed by the bit mask of the fields present (year,
+# month, day, from most-significant); each entry holds the formatters
+# for the basic and extended formats.  The extended format is only
+# distinct for complete dates.
+_formats = (
+    None,
+    (lambda y, m, d: '--' + _d2[d],) * 2,
+    None,
+    (lambda y, m, d: '-' + _d2[m] + _d2[d],) * 2,
+    (lambda y, m, d: _d4[y],) * 2,
+    None,
+    (lambda y, m, d: _d4[y] + '-' + _d2[m],) * 2,
+    (lambda y, m, d: _d4[y] + _d2[m] + _d2[d],
+     lambda y, m, d: _d4[y] + '-' + _d2[m] + '-' + _d2[d]),
+)
+
+
+# Lengths of the values produced by the formatters.
+_lengths = tuple(
+    None if formatters is None
+    else tuple(len(formatter(0, 1, 1)) for formatter in formatters)
+    for formatters in _formats
+)
+
+
+def _mask(year, month, day):
+    return ((year is not None) << 2
+            | (month is not None) << 1
+            | (day is not None))
+
+
+def _isoformat(mask, year, month, day, extended):
+    """Format date fields; see :meth:`Date.isoformat`."""
+    return _formats[mask][bool(extended)](year, month, day)
+
+
+class Date(fd.partialdate.utils.ParseCaching):
     """Date representation supporting partial values."""
 
-    __slots__ = 'year', 'month', 'day', 'partial'
+    __slots__ = (
+        'year', 'month', 'day', 'partial', 'precision', '_mask', '_sort_key',
+        '_hash', '_basic_text', '_extended_text', '_source', '__weakref__',
+    )
 
     year: typing.Optional[int]
     """Calendar year, or ``None``."""
@@ -109,40 +394,137 @@ class Date:
     partial: bool
     """Indicates whether the value is partial (``True``) or complete."""
 
+    precision: Precision
+    """Fields present in the value."""
+
     def __init__(self, year=None, month=None, day=None):
-        if year is None and day is None:
-            if month:
-                raise ValueError('must specify year or day along with month')
-            else:
-                raise ValueError('must specify year or day')
-        if year is not None:
-            if not (0 <= year <= 9999):
-                raise fd.partialdate.exceptions.RangeError(
-                    'year', year, 0, 9999)
-        if month is None:
-            if year is not None and day is not None:
-                raise ValueError('cannot specify year and day without month')
-            if day is not None:
-                if not (1 <= day <= 31):
-                    raise fd.partialdate.exceptions.RangeError(
-                        'day', day, 1, 31)
+        _check(year, month, day)
+        # Fields and keys are set inline here and in _from_fields, since
+        # construction is a large part of parsing.
+        self.year = year
+        self.month = month
+        self.day = day
+        if year is not None and day is not None:
+            # Complete, so the month is present too.
+            self.partial = False
+            self.precision = _complete
+            self._mask = 0b111
+            self._sort_key = year * 0x400 + _month_keys[month] + day
         else:
-            if not (1 <= month <= 12):
-                raise fd.partialdate.exceptions.RangeError(
-                    'month', month, 1, 12)
+            mask = key = 0
+            if year is not None:
+                mask = 0b100
+                key = (year + 1) << 10
+            if month is not None:
+                mask |= 0b010
+                key |= (month + 1) << 6
             if day is not None:
-                dim = _days_in_month[month]
-                if year is not None and year % 4 and month == 2:
-                    dim -= 1
-                if not (1 <= day <= dim):
-                    raise fd.partialdate.exceptions.RangeError(
-                        'day', day, 1, dim)
+                mask |= 0b001
+                key |= day + 1
+            self.partial = True
+            self.precision = _precisions[mask]
+            self._mask = mask
+            self._sort_key = _leading_fields[mask] << 24 | key
+        self._hash = None
+        self._basic_text = None
+        self._extended_text = None
+        self._source = None
+
+    @classmethod
+    def _from_fields(cls, year, month, day):
+        """Construct a date from fields that have already been checked."""
+        self = _new(cls)
         self.year = year
         self.month = month
         self.day = day
-        # No need to check month since if month is None, at least one of
-        # year or day must be None.
-        self.partial = year is None or day is None
+        if year is not None and day is not None:
+            # Complete, so the month is present too.
+            self.partial = False
+            self.precision = _complete
+            self._mask = 0b111
+            self._sort_key = year * 0x400 + _month_keys[month] + day
+        else:
+            mask = key = 0
+            if year is not None:
+                mask = 0b100
+                key = (year + 1) << 10
+            if month is not None:
+                mask |= 0b010
+                key |= (month + 1) << 6
+            if day is not None:
+                mask |= 0b001
+                key |= day + 1
+            self.partial = True
+            self.precision = _precisions[mask]
+            self._mask = mask
+            self._sort_key = _leading_fields[mask] << 24 | key
+        self._hash = None
+        self._basic_text = None
+        self._extended_text = None
+        self._source = None
+        return self
+
+    @classmethod
+    def intern(cls, year=None, month=None, day=None):
+        """Return a shared instance representing the specified date.
+
+        Repeated calls with the same fields return the same object for
+        as long as it remains referenced elsewhere, as do calls to
+        :meth:`isoparse` with *intern* set.
+
+        """
+        value = fd.partialdate.utils.interned((cls, year, month, day))
+        if value is None:
+            value = cls(year, month, day)._intern()
+        return value
+
+    def _intern(self):
+        return fd.partialdate.utils.intern(
+            (self.__class__, self.year, self.month, self.day), self)
+
+    def __reduce__(self):
+        # Rebuild from the fields, so cached hashes and text are not
+        # pickled; hashes of complete values vary between processes.
+        return self.__class__, (self.year, self.month, self.day)
+
+    @classmethod
+    def from_year_ordinal(cls, year: int, ordinal: int):
+        """Construct a date from a year and ordinal day of the year.
+
+        :param year:  Calendar year
+        :param ordinal:  Day of the year, starting with 1 for January 1
+
+        """
+        if not (0 <= year <= 9999):
+            raise fd.partialdate.exceptions.RangeError(
+                'year', year, 0, 9999)
+        if ordinal < 1:
+            raise fd.partialdate.exceptions.RangeError(
+                'ordinal day', ordinal, 1, 365 + (year % 4 == 0))
+        month, day = _ordinal_month_day(year, ordinal)
+        return cls._from_fields(year, month, day)
+
+    def toordinal_in_year(self) -> int:
+        """Return the day of the year, starting with 1 for January 1.
+
+        Only complete dates have an ordinal day.
+
+        """
+        if self.partial:
+            raise ValueError('ordinal day requires a complete date')
+        isleap = self.year % 4 == 0
+        return _days_before_month[isleap][self.month - 1] + self.day
+
+    def sort_key(self) -> int:
+        """Return an integer that orders the same way as the date.
+
+        This is suitable as the *key* for :func:`sorted` and similar
+        functions.  Values of differing precision, which cannot be
+        ordered against each other, are grouped by precision, with
+        values including the year first and day-only values last.
+
+        """
+        return self._sort_key
 
     def __repr__(self):
         cls = self.__class__
@@ -167,74 +549,72 @@ class Date:
     def __str__(self):
         return self.isoformat()
 
-    def __eq__(self, other):
+    def _other_key(self, other, action):
+        # Return the comparison key and precision for other, or None if
+        # comparisons with other are not supported.
+        if isinstance(other, Date):
+            return other._sort_key, other._mask
         if isinstance(other, datetime.datetime):
             ocls = other.__class__
             raise TypeError(
-                f"comparison not supported between instances of"
+                f"{action} not supported between instances of"
                 f" '{self.__class__.__name__}' and"
                 f" '{ocls.__module__}.{ocls.__qualname__}'")
         if isinstance(other, datetime.date):
-            odata = other.year, other.month, other.day
-        elif isinstance(other, Date):
-            odata = (
-                -1 if other.year is None else other.year,
-                -1 if other.month is None else other.month,
-                -1 if other.day is None else other.day,
-            )
-        else:
+            return _sort_key(other.year, other.month, other.day), 0b111
+        return None
+
+    def _compare(self, other, op):
+        found = self._other_key(other, 'ordering')
+        if found is None:
             return NotImplemented
-        sdata = (
-            -1 if self.year is None else self.year,
-            -1 if self.month is None else self.month,
-            -1 if self.day is None else self.day,
-        )
-        return sdata == odata
+        okey, omask = found
+        # Values can be ordered if they start with the same field.
+        if _leading_fields[self._mask] != _leading_fields[omask]:
+            raise ValueError('ordering not supported between'
+                             ' incompatible partial dates')
+        return op(self._sort_key, okey)
 
-    def __lt__(self, other):
-        if isinstance(other, datetime.datetime):
-            ocls = other.__class__
-            raise TypeError(
-                f"ordering not supported between instances of"
-                f" '{self.__class__.__name__}' and"
-                f" '{ocls.__module__}.{ocls.__qualname__}'")
-        if isinstance(other, datetime.date):
-            odata = other.year, other.month, other.day
-            oparts = True, True, True
-        elif isinstance(other, Date):
-            odata = (
-                -1 if other.year is None else other.year,
-                -1 if other.month is None else other.month,
-                -1 if other.day is None else other.day,
-            )
-            oparts = (
-                other.year is not None,
-                other.month is not None,
-                other.day is not None,
-            )
-        else:
+    def __eq__(self, other):
+        found = self._other_key(other, 'comparison')
+        if found is None:
+            return NotImplemented
+        return self._sort_key == found[0]
+
+    def __ne__(self, other):
+        found = self._other_key(other, 'comparison')
+        if found is None:
             return NotImplemented
-        sparts = bool(self.year), bool(self.month), bool(self.day)
-        sparts = (
-            self.year is not None,
-            self.month is not None,
-            self.day is not None,
-        )
-        if False in sparts or False in oparts:
-            # No need to check for ValueError; every case will include
-            # at least one True value since we disallow completely
-            # unspecified values.
-            oprecision = oparts.index(True)
-            sprecision = sparts.index(True)
-            if oprecision != sprecision:
-                raise ValueError('ordering not supported between'
-                                 ' incompatible partial dates')
-        sdata = (
-            -1 if self.year is None else self.year,
-            -1 if self.month is None else self.month,
-            -1 if self.day is None else self.day,
-        )
-        return sdata < odata
+        return self._sort_key != found[0]
+
+    def __hash__(self):
+        # Complete dates can be equal to standard library dates, so they
+        # need to hash the same way.  Year 0 cannot be represented by
+        # datetime.date, so those never compare equal to one.
+        if self._hash is None:
+            if self.partial or not self.year:
+                self._hash = hash(self._sort_key)
+            else:
+                try:
+                    self._hash = hash(
+                        datetime.date(self.year, self.month, self.day))
+                except ValueError:
+                    # February 29 in a year such as 1900, which datetime
+                    # rejects, so never equal to a standard library date.
+                    self._hash = hash(self._sort_key)
+        return self._hash
+
+    def __lt__(self, other):
+        return self._compare(other, operator.lt)
+
+    def __le__(self, other):
+        return self._compare(other, operator.le)
+
+    def __gt__(self, other):
+        return self._compare(other, operator.gt)
+
+    def __ge__(self, other):
+        return self._compare(other, operator.ge)
 
     def isoformat(self, extended: bool = True):
         """Return an ISO 8601 formatted version of the date.
@@ -246,46 +626,168 @@ class Date:
         basic format will always be used for partial values.
 
         """
-        parts = [
-            (f'{self.year:04}' if self.year is not None else '-'),
-            (f'{self.month:02}' if self.month is not None else '-'),
-            (f'{self.day:02}' if self.day is not None else '-'),
-        ]
-        if self.month and not self.day:
-            assert self.year is not None
-            return '-'.join(parts).rstrip('-')
-        if self.partial or not extended:
-            return ''.join(parts).rstrip('-')
+        if self._source is not None:
+            self._reuse_source()
+        if extended:
+            text = self._extended_text
+            if text is None:
+                text = _isoformat(
+                    self._mask, self.year, self.month, self.day, True)
+                self._extended_text = text
         else:
-            return '-'.join(parts).rstrip('-')
+            text = self._basic_text
+            if text is None:
+                text = _isoformat(
+                    self._mask, self.year, self.month, self.day, False)
+                self._basic_text = text
+        return text
+
+    def _reuse_source(self):
+        # Retain the text the date was parsed from if it is a canonical
+        # representation, so it does not need to be formatted again.
+        # This is checked when the date is first formatted rather than
+        # when it is parsed, since many parsed values never are.
+        # Ordinal dates are not retained.  Only one form is accepted for
+        # each length, given the fields that are present.
+        text = self._source
+        self._source = None
+        if text[-1:] == '\n' or not fd.partialdate.utils.isascii(text):
+            return
+        basic, extended = _lengths[self._mask]
+        n = len(text)
+        if n == basic:
+            self._basic_text = text
+        if n == extended:
+            self._extended_text = text
 
     @classmethod
-    def isoparse(cls, text: str):
+    def isoparse(cls, text: typing.Union[str, bytes], intern: bool = False):
         """Parse an ISO 8601 basic or extended date representation.
 
-        :param text:  ISO 8601 representation to convert
+        :param text:
+            ISO 8601 representation to convert; may be a :class:`str`
+            or any bytes-like object containing ASCII text
+        :param intern:
+            Return the shared instance for the parsed value, as for
+            :meth:`intern`
 
         Ordinal dates must include the year, and will be converted to
         year-month-day representations assuming the proleptic Gregorian
         calendar.
 
         """
-        m = _rx.match(text)
-        if m is None:
+        cache = cls._parse_cache
+        if cache is not None and cache.owner is cls:
+            value = cache.parse(cls._isoparse, text)
+        else:
+            value = cls._isoparse(text)
+        if intern:
+            value = value._intern()
+        return value
+
+    @classmethod
+    def try_isoparse(cls, text: typing.Union[str, bytes], default=None):
+        """Parse an ISO 8601 date representation, or return a default.
+
+        :param text:
+            ISO 8601 representation to convert, as for :meth:`isoparse`
+        :param default:
+            Value to return if the text cannot be converted
+
+        Text that does not have the syntax of a supported format is
+        rejected without an exception being raised, so this is cheaper
+        than handling exceptions from :meth:`isoparse` when many values
+        are malformed.
+
+        """
+        cache = cls._parse_cache
+        if cache is not None and cache.owner is cls:
+            value = cache.parse(cls._try_isoparse, text)
+        else:
+            value = cls._try_isoparse(text)
+        return default if value is None else value
+
+    @classmethod
+    def _try_isoparse(cls, text):
+        text, fields = _decode(text)
+        if fields is None:
+            return None
+        try:
+            return cls._from_decoded(text, fields)
+        except ValueError:
+            return None
+
+    @classmethod
+    def _isoparse(cls, text):
+        text, fields = _decode(text)
+        if fields is None:
             raise fd.partialdate.exceptions.ParseError(
-                'ISO 8601 date', text)
-        year, month, day, ordinal = m.group('year', 'month', 'day', 'ordinal')
-        if ordinal is None:
-            if day is None and month == '-':
-                raise fd.partialdate.exceptions.ParseError(
-                    'ISO 8601 date', text)
-        year, month, day, ordinal = [
-            None if v in ('-', None) else int(v)
-            for v in (year, month, day, ordinal)
-        ]
+                'ISO 8601 date', fd.partialdate.utils.ascii_text(text))
+        return cls._from_decoded(text, fields)
+
+    @classmethod
+    def _from_decoded(cls, text, fields):
+        year, month, day, ordinal = fields
         if ordinal is not None:
             month, day = _ordinal2md('ISO 8601 date', text, year, ordinal)
-        return cls(year=year, month=month, day=day)
+        _check(year, month, day)
+        self = cls._from_fields(year, month, day)
+        if ordinal is None and text.__class__ is str:
+            self._source = text
+        return self
+
+    @classmethod
+    def isoparse_many(cls, values, errors: str = 'raise'):
+        """Parse a sequence of ISO 8601 date representations.
+
+        :param values:  Iterable of ISO 8601 representations to convert
+        :param errors:
+            How values that cannot be converted are handled:
+            ``'raise'`` propagates the exception, ``'skip'`` omits the
+            value, ``'none'`` substitutes ``None``, and ``'collect'``
+            substitutes ``None`` and records the failure.
+
+        A list of converted values is returned.  For ``'collect'``, a
+        second list is returned as well, containing pairs of the
+        position of each failing value and the exception describing
+        the failure.
+
+        """
+        return fd.partialdate.utils.parse_many(
+            cls.isoparse, cls.try_isoparse, values, errors)
+
+    @classmethod
+    def isoformat_many(cls, values, extended: bool = True) -> typing.List[str]:
+        """Return ISO 8601 representations of a sequence of dates.
+
+        :param values:  Iterable of dates to format
+        :param extended:
+            Prefer the extended format, if applicable for each value
+
+        """
+        return list(map(
+            functools.partial(cls.isoformat, extended=extended), values))
+
+    @classmethod
+    def write_iso(cls, values, fileobj, terminator: str = '\n',
+                  extended: bool = True) -> int:
+        """Write ISO 8601 representations of dates to a file.
+
+        :param values:  Iterable of dates to format
+        :param fileobj:
+            Text or binary file object to write to; binary file objects
+            receive ASCII-encoded text
+        :param terminator:  Text written after each value
+        :param extended:
+            Prefer the extended format, if applicable for each value
+
+        Values are written in batches rather than individually.  The
+        number of values written is returned.
+
+        """
+        return fd.partialdate.utils.write_formatted(
+            functools.partial(cls.isoformat, extended=extended),
+            values, fileobj, terminator)
 
 
 Date.min = Date(1, 1, 1)
@@ -7,10 +7,12 @@ Sub-second resolutions are not supported.
 
 import datetime
 import functools
+import operator
 import typing
 
 import fd.partialdate.date
 import fd.partialdate.exceptions
+import fd.partialdate.precision
 import fd.partialdate.time
 import fd.partialdate.utils
 
@@ -58,61 +60,589 @@ _re_extended = r"""
     (?P<tzinfo>[zZ]|[-+]\d{2}|[-+]\d{2}:\d{2})?
     $
 """
+
+
+def _select(text):
+    # Only the extended format allows ':', and requires it.
+    if ':' in text:
+        return (0,)
+    return (1,)
+
+
 _rx = fd.partialdate.utils.RegularExpressionGroup(
     _re_extended,
     _re_basic,
+    names=('year', 'month', 'day', 'ordinal',
+           'hour', 'minute', 'second', 'tzinfo'),
+    select=_select,
 )
 
 
-@functools.total_ordering
-class Datetime:
+def _match(text):
+    """Decode datetime fields using the regular expressions.
+
+    This is the reference implementation for :func:`_scan`; it returns
+    the same results, but is considerably slower.
+
+    """
+    found = _rx.match(text)
+    if found is None:
+        return None
+    alternative, fields = found
+    year, month, day, ordinal, hour, minute, second, tzstr = fields
+    if alternative == 1:
+        # Only the basic format allows '-' placeholders.
+        if ordinal is None:
+            if day is None and month == '-':
+                return None
+        elif year == '-':
+            return None
+        year, month, hour, minute = [
+            None if v == '-' else v
+            for v in (year, month, hour, minute)
+        ]
+    fields = tuple(
+        None if v is None else int(v)
+        for v in (year, month, day, ordinal, hour, minute, second)
+    )
+    return fields + (tzstr,)
+
+
+def _scanner(newline, dash, colon, separators, isdigits, pairs, scan_tz,
+             tztext):
+    # Create a scanner for either str or bytes; the constants, the
+    # table of digit pairs, and the helper functions must match the type
+    # of text to be scanned.  tztext converts a zone designator to str,
+    # if needed.
+
+    def _scan(text):
+        """Decode datetime fields from text without regular expressions.
+
+        Returns a tuple of year, month, day, ordinal day, hour, minute,
+        second, and zone designator (or ``None``), or ``None`` if the
+        text does not have the syntax of a supported datetime format.
+        Range checks are left to the caller.
+
+        The date and time portions are decoded together; the extended
+        format is used for both or neither.
+
+        """
+        if text[-1:] == newline:
+            # The regular expressions accept a single trailing newline
+            # since ``$`` matches just before it; we need to do the same.
+            text = text[:-1]
+        n = len(text)
+        # Complete dates with the time to at least the minute are
+        # decoded at fixed positions for the common lengths, without
+        # searching for the separator.  Fields are looked up as pairs of
+        # ASCII digits; text not accepted here is left to the general
+        # case below.
+        if n in (16, 19, 20, 22, 25) and text[10:11] in separators:
+            # YYYY-MM-DDThh:mm, YYYY-MM-DDThh:mm:ss, and zone designators
+            k = 19 if text[16:17] == colon else 16
+            tzstr = text[k:]
+            if (text[4:5] == dash and text[7:8] == dash
+                    and text[13:14] == colon
+                    and (not tzstr or scan_tz(tzstr, True))):
+                try:
+                    year = pairs[text[:2]] * 100 + pairs[text[2:4]]
+                    month = pairs[text[5:7]]
+                    day = pairs[text[8:10]]
+                    hour = pairs[text[11:13]]
+                    minute = pairs[text[14:16]]
+                    second = pairs[text[17:19]] if k == 19 else None
+                except KeyError:
+                    pass
+                else:
+                    if not tzstr:
+                        tzstr = None
+                    elif tztext is not None:
+                        tzstr = tztext(tzstr)
+                    return year, month, day, None, hour, minute, second, tzstr
+        elif n in (13, 15, 16, 18, 20) and text[8:9] in separators:
+            # YYYYMMDDThhmm, YYYYMMDDThhmmss, and zone designators
+            k = 13 if n == 13 else 15
+            tzstr = text[k:]
+            if not tzstr or scan_tz(tzstr, False):
+                try:
+                    year = pairs[text[:2]] * 100 + pairs[text[2:4]]
+                    month = pairs[text[4:6]]
+                    day = pairs[text[6:8]]
+                    hour = pairs[text[9:11]]
+                    minute = pairs[text[11:13]]
+                    second = pairs[text[13:15]] if k == 15 else None
+                except KeyError:
+                    pass
+                else:
+                    if not tzstr:
+                        tzstr = None
+                    elif tztext is not None:
+                        tzstr = tztext(tzstr)
+                    return year, month, day, None, hour, minute, second, tzstr
+        # Neither portion can contain any of the separator characters,
+        # so the first one found is the only candidate.
+        i = text.find(separators[0])
+        if i < 0:
+            i = text.find(separators[1])
+            if i < 0:
+                i = text.find(separators[2])
+                if i < 0:
+                    return None
+        t = text[i + 1:]
+        n = len(t)
+        year = month = day = ordinal = None
+        hour = minute = second = None
+
+        if i in (8, 10) and text[4:5] == dash and isdigits(text[:4]):
+            # YYYY-MM-DD, YYYY-DDD
+            if i == 10:
+                if not (text[7:8] == dash and isdigits(text[5:7])
+                        and isdigits(text[8:10])):
+                    return None
+                month = int(text[5:7])
+                day = int(text[8:10])
+            else:
+                if not isdigits(text[5:8]):
+                    return None
+                ordinal = int(text[5:8])
+            year = int(text[:4])
+            # hh:mm, hh:mm:ss
+            if n < 5 or not (t[2:3] == colon and isdigits(t[:2])
+                             and isdigits(t[3:5])):
+                return None
+            hour = int(t[:2])
+            minute = int(t[3:5])
+            if t[5:6] == colon:
+                if n < 8 or not isdigits(t[6:8]):
+                    return None
+                second = int(t[6:8])
+                tzstr = t[8:]
+            else:
+                tzstr = t[5:]
+            if not tzstr:
+                tzstr = None
+            elif not scan_tz(tzstr, True):
+                return None
+            elif tztext is not None:
+                tzstr = tztext(tzstr)
+            return year, month, day, ordinal, hour, minute, second, tzstr
+
+        # Basic format; the date is YYYY or -, optionally followed by MM
+        # or -, and DD, or by DDD.
+        if text[:1] == dash:
+            r = text[1:i]
+        elif i >= 4 and isdigits(text[:4]):
+            year = int(text[:4])
+            r = text[4:i]
+        else:
+            return None
+        if r:
+            if r[:1] == dash:
+                if len(r) != 3 or not isdigits(r[1:]):
+                    return None
+                day = int(r[1:])
+            elif not isdigits(r):
+                return None
+            elif len(r) == 2:
+                month = int(r)
+            elif len(r) == 4:
+                month = int(r[:2])
+                day = int(r[2:])
+            elif len(r) == 3 and year is not None:
+                ordinal = int(r)
+            else:
+                return None
+
+        # The time is hh or -, optionally followed by mm or - and then
+        # optionally ss, and finally an optional zone designator.  Where
+        # a '-' could either be a placeholder or the sign of the zone
+        # designator, the placeholder is preferred if that allows the
+        # entire time to be decoded, as for the regular expression.
+        if t[:1] == dash:
+            r = t[1:]
+        elif n >= 2 and isdigits(t[:2]):
+            hour = int(t[:2])
+            r = t[2:]
+        else:
+            return None
+        if r[:1] == dash:
+            k = 1
+        elif len(r) >= 2 and isdigits(r[:2]):
+            k = 2
+        else:
+            k = 0
+        tzstr = r
+        if k:
+            rest = r[k:]
+            if (len(rest) >= 2 and isdigits(rest[:2])
+                    and scan_tz(rest[2:], False)):
+                second = int(rest[:2])
+                tzstr = rest[2:]
+            elif scan_tz(rest, False):
+                tzstr = rest
+            else:
+                k = 0
+            if k == 2:
+                minute = int(r[:2])
+        if not k and not scan_tz(tzstr, False):
+            return None
+        if not tzstr:
+            tzstr = None
+        elif tztext is not None:
+            tzstr = tztext(tzstr)
+        return year, month, day, ordinal, hour, minute, second, tzstr
+
+    return _scan
+
+
+_scan = _scanner(
+    '\n', '-', ':', 'Tt ', str.isdecimal,
+    fd.partialdate.utils.two_digit_values,
+    fd.partialdate.time._scan_tz, None)
+_scan_bytes = _scanner(
+    b'\n', b'-', b':', (b'T', b't', b' '), bytes.isdigit,
+    fd.partialdate.utils.two_digit_bytes_values,
+    fd.partialdate.time._scan_tz_bytes, bytes.decode)
+
+
+# The hand-written scanner is used by default; the regular expressions
+# are retained as a reference implementation, and may be selected by
+# assigning _match here.
+_parse_fields = _scan
+
+
+def _decode(text):
+    # Return the text, converted to bytes if not a str, and the decoded
+    # fields, or None if the text does not have a supported syntax.
+    if isinstance(text, str):
+        return text, _parse_fields(text)
+    text = fd.partialdate.utils.ascii_bytes(text)
+    return text, _scan_bytes(text)
+
+
+Precision = fd.partialdate.precision.Precision
+
+_date_precisions = fd.partialdate.precision.date_precisions
+_time_precisions = fd.partialdate.precision.time_precisions
+_leading_fields = fd.partialdate.precision.leading_fields
+_month_keys = fd.partialdate.date._month_keys
+_hour_keys = fd.partialdate.time._hour_keys
+_minute_keys = fd.partialdate.time._minute_keys
+_second_keys = fd.partialdate.time._second_keys
+_time_key_bits = fd.partialdate.time._sort_key_bits
+_new = object.__new__
+
+
+_microsecond = datetime.timedelta(microseconds=1)
+_second = datetime.timedelta(seconds=1)
+_epoch = datetime.datetime(1, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+def _utc_key(year, month, day, hour, minute, second, microsecond, tzinfo):
+    """Pack an aware datetime into an integer that orders like UTC times.
+
+    The result counts microseconds since 0001-01-01T00:00:00Z in the
+    proleptic Gregorian calendar, so it orders like comparisons of aware
+    :class:`datetime.datetime` values.  ``None`` is returned unless the
+    time zone is a :class:`datetime.timezone`, which is known to have a
+    fixed offset, and the date can be represented by
+    :class:`datetime.date`.
+
+    """
+    if tzinfo.__class__ is not datetime.timezone:
+        return None
+    isleap = year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+    if year < 1 or (day == 29 and month == 2 and not isleap):
+        return None
+    y = year - 1
+    days = (y * 365 + y // 4 - y // 100 + y // 400
+            + fd.partialdate.date._days_before_month[isleap][month - 1]
+            + day - 1)
+    return ((days * 86400 + hour * 3600 + minute * 60 + second) * 1000000
+            + microsecond - tzinfo.utcoffset(None) // _microsecond)
+
+
+class Datetime(fd.partialdate.utils.ParseCaching):
     """Datetime representation supporting partial values."""
 
-    __slots__ = ('_date', '_time', 'partial')
+    __slots__ = (
+        'year', 'month', 'day', 'hour', 'minute', 'second', 'tzinfo',
+        'partial', 'date_precision', 'time_precision', '_date_mask',
+        '_time_mask', '_sort_key',
+        '_utc_key', '_hash', '_basic_text', '_extended_text', '_source',
+        '__weakref__',
+    )
+
+    year: typing.Optional[int]
+    """Calendar year, or ``None``."""
+
+    month: typing.Optional[int]
+    """Calendar month, or ``None``."""
+
+    day: typing.Optional[int]
+    """Calendar day, or ``None``."""
+
+    hour: typing.Optional[int]
+    """Hour of day, or ``None``."""
+
+    minute: typing.Optional[int]
+    """Minute of hour, or ``None``."""
+
+    second: typing.Optional[int]
+    """Second of minute, or ``None``."""
+
+    tzinfo: typing.Optional[datetime.timezone]
+    """Timezone applied to time, or ``None`` for local time."""
 
     partial: bool
     """Indicates whether the value is partial (``True``) or complete."""
 
+    date_precision: Precision
+    """Date fields present in the value."""
+
+    time_precision: Precision
+    """Time fields present in the value."""
+
     def __init__(self, year=None, month=None, day=None,
                  hour=None, minute=None, second=None, tzinfo=None):
-        self._date = fd.partialdate.date.Date(year, month, day)
-        self._time = fd.partialdate.time.Time(hour, minute, second, tzinfo)
-        self.partial = self._date.partial or self._time.partial
-
-    @property
-    def year(self) -> typing.Optional[int]:
-        """Calendar year, or ``None``."""
-        return self._date.year
-
-    @property
-    def month(self) -> typing.Optional[int]:
-        """Calendar month, or ``None``."""
-        return self._date.month
-
-    @property
-    def day(self) -> typing.Optional[int]:
-        """Calendar day, or ``None``."""
-        return self._date.day
-
-    @property
-    def hour(self) -> typing.Optional[int]:
-        """Hour of day, or ``None``."""
-        return self._time.hour
-
-    @property
-    def minute(self) -> typing.Optional[int]:
-        """Minute of hour, or ``None``."""
-        return self._time.minute
-
-    @property
-    def second(self) -> typing.Optional[int]:
-        """Second of minute, or ``None``."""
-        return self._time.second
-
-    @property
-    def tzinfo(self) -> typing.Optional[datetime.timezone]:
-        """Timezone applied to time, or ``None`` for local time."""
-        return self._time.tzinfo
+        fd.partialdate.date._check(year, month, day)
+        fd.partialdate.time._check(hour, minute, second)
+        # Fields and keys are set inline here and in _from_fields, since
+        # construction is a large part of parsing.  The date and time
+        # keys are built as in the Date and Time constructors.
+        self.year = year
+        self.month = month
+        self.day = day
+        self.hour = hour
+        self.minute = minute
+        self.second = second
+        self.tzinfo = tzinfo
+        if year is not None and day is not None:
+            dmask = 0b111
+            dkey = year * 0x400 + _month_keys[month] + day
+        else:
+            dmask = dkey = 0
+            if year is not None:
+                dmask = 0b100
+                dkey = (year + 1) << 10
+            if month is not None:
+                dmask |= 0b010
+                dkey |= (month + 1) << 6
+            if day is not None:
+                dmask |= 0b001
+                dkey |= day + 1
+            dkey |= _leading_fields[dmask] << 24
+        if hour is not None and second is not None:
+            tmask = 0b111
+            tkey = (_hour_keys[hour] + _minute_keys[minute]
+                    + _second_keys[second])
+        else:
+            tmask = tkey = 0
+            if hour is not None:
+                tmask = 0b100
+                tkey = _hour_keys[hour]
+            if minute is not None:
+                tmask |= 0b010
+                tkey |= _minute_keys[minute]
+            if second is not None:
+                tmask |= 0b001
+                tkey |= _second_keys[second]
+            tkey |= _leading_fields[tmask] << 37
+        self.partial = dmask != 0b111 or tmask != 0b111
+        self.date_precision = _date_precisions[dmask]
+        self.time_precision = _time_precisions[tmask]
+        self._date_mask = dmask
+        self._time_mask = tmask
+        self._sort_key = dkey << _time_key_bits | tkey
+        self._utc_key = None
+        self._hash = None
+        self._basic_text = None
+        self._extended_text = None
+        self._source = None
+
+    @classmethod
+    def _from_fields(cls, year, month, day, hour, minute, second, tzinfo):
+        """Construct a datetime from fields that have already been checked."""
+        self = _new(cls)
+        self.year = year
+        self.month = month
+        self.day = day
+        self.hour = hour
+        self.minute = minute
+        self.second = second
+        self.tzinfo = tzinfo
+        if year is not None and day is not None:
+            dmask = 0b111
+            dkey = year * 0x400 + _month_keys[month] + day
+        else:
+            dmask = dkey = 0
+            if year is not None:
+                dmask = 0b100
+                dkey = (year + 1) << 10
+            if month is not None:
+                dmask |= 0b010
+                dkey |= (month + 1) << 6
+            if day is not None:
+                dmask |= 0b001
+                dkey |= day + 1
+            dkey |= _leading_fields[dmask] << 24
+        if hour is not None and second is not None:
+            tmask = 0b111
+            tkey = (_hour_keys[hour] + _minute_keys[minute]
+                    + _second_keys[second])
+        else:
+            tmask = tkey = 0
+            if hour is not None:
+                tmask = 0b100
+                tkey = _hour_keys[hour]
+            if minute is not None:
+                tmask |= 0b010
+                tkey |= _minute_keys[minute]
+            if second is not None:
+                tmask |= 0b001
+                tkey |= _second_keys[second]
+            tkey |= _leading_fields[tmask] << 37
+        self.partial = dmask != 0b111 or tmask != 0b111
+        self.date_precision = _date_precisions[dmask]
+        self.time_precision = _time_precisions[tmask]
+        self._date_mask = dmask
+        self._time_mask = tmask
+        self._sort_key = dkey << _time_key_bits | tkey
+        self._utc_key = None
+        self._hash = None
+        self._basic_text = None
+        self._extended_text = None
+        self._source = None
+        return self
+
+    @classmethod
+    def combine(cls, date, time):
+        """Combine a date and a time into a datetime.
+
+        :param date:
+            Date to use; a :class:`~fd.partialdate.date.Date` or
+            :class:`datetime.date`
+        :param time:
+            Time to use; a :class:`~fd.partialdate.time.Time` or
+            :class:`datetime.time`
+
+        The fields of the date and time have already been checked, so
+        they are not checked again.  Standard library times with
+        non-zero microseconds cannot be used.
+
+        """
+        if isinstance(date, datetime.datetime):
+            raise TypeError('combine() argument 1 must be a date,'
+                            ' not datetime.datetime')
+        if not isinstance(date, (datetime.date, fd.partialdate.date.Date)):
+            raise TypeError(f'combine() argument 1 must be a date,'
+                            f' not {date.__class__.__name__}')
+        if isinstance(time, datetime.time):
+            if time.microsecond:
+                raise ValueError('sub-second resolution is not supported')
+        elif not isinstance(time, fd.partialdate.time.Time):
+            raise TypeError(f'combine() argument 2 must be a time,'
+                            f' not {time.__class__.__name__}')
+        return cls._from_fields(date.year, date.month, date.day,
+                                time.hour, time.minute, time.second,
+                                time.tzinfo)
+
+    def date(self) -> fd.partialdate.date.Date:
+        """Return the date portion of the datetime."""
+        return fd.partialdate.date.Date._from_fields(
+            self.year, self.month, self.day)
+
+    def time(self) -> fd.partialdate.time.Time:
+        """Return the time portion of the datetime, without a time zone."""
+        return fd.partialdate.time.Time._from_fields(
+            self.hour, self.minute, self.second, None)
+
+    def timetz(self) -> fd.partialdate.time.Time:
+        """Return the time portion of the datetime, with the time zone."""
+        return fd.partialdate.time.Time._from_fields(
+            self.hour, self.minute, self.second, self.tzinfo)
+
+    @classmethod
+    def intern(cls, year=None, month=None, day=None,
+               hour=None, minute=None, second=None, tzinfo=None):
+        """Return a shared instance representing the specified datetime.
+
+        Repeated calls with the same fields return the same object for
+        as long as it remains referenced elsewhere, as do calls to
+        :meth:`isoparse` with *intern* set.  Equal time zones are not
+        distinguished.
+
+        """
+        key = (cls, year, month, day, hour, minute, second, tzinfo)
+        value = fd.partialdate.utils.interned(key)
+        if value is None:
+            value = cls(year, month, day,
+                        hour, minute, second, tzinfo)._intern()
+        return value
+
+    def _intern(self):
+        return fd.partialdate.utils.intern(
+            (self.__class__, self.year, self.month, self.day,
+             self.hour, self.minute, self.second, self.tzinfo),
+            self)
+
+    def __reduce__(self):
+        # Rebuild from the fields, so cached hashes and text are not
+        # pickled; hashes of complete values vary between processes.
+        return self.__class__, (
+            self.year, self.month, self.day,
+            self.hour, self.minute, self.second, self.tzinfo)
+
+    def timestamp_key(self) -> int:
+        """Return the number of seconds since 0001-01-01T00:00:00Z.
+
+        Only complete datetimes with a time zone have a timestamp key.
+        Values representing the same instant have the same key,
+        regardless of time zone, so this is suitable as the *key* for
+        :func:`sorted` and similar functions when values come from
+        several time zones.
+
+        The proleptic Gregorian calendar is used, as for
+        :class:`datetime.datetime`; ValueError is raised for dates it
+        cannot represent.
+
+        """
+        if self.partial:
+            raise ValueError('timestamp key requires a complete datetime')
+        if self.tzinfo is None:
+            raise ValueError('timestamp key requires a time zone')
+        key = self._get_utc_key()
+        if key is None:
+            # Let datetime work out the offset, or reject the date.
+            return (self._stdlib(0) - _epoch) // _second
+        return key // 1000000
+
+    def _get_utc_key(self):
+        key = self._utc_key
+        if key is None:
+            key = _utc_key(self.year, self.month, self.day, self.hour,
+                           self.minute, self.second, 0, self.tzinfo)
+            self._utc_key = key
+        return key
+
+    def _stdlib(self, microsecond):
+        return datetime.datetime(
+            year=self.year, month=self.month, day=self.day,
+            hour=self.hour, minute=self.minute, second=self.second,
+            microsecond=microsecond, tzinfo=self.tzinfo)
+
+    def sort_key(self) -> int:
+        """Return an integer that orders the same way as the datetime.
+
+        This is suitable as the *key* for :func:`sorted` and similar
+        functions.  Values are ordered by date, then by time, with values
+        of differing precision grouped as for
+        :meth:`Date.sort_key <fd.partialdate.date.Date.sort_key>` and
+        :meth:`Time.sort_key <fd.partialdate.time.Time.sort_key>`.  Time
+        zones are not considered.
+
+        """
+        return self._sort_key
 
     def __repr__(self) -> str:
         cls = self.__class__
@@ -138,98 +668,131 @@ class Datetime:
 
         return f'{cls.__module__}.{cls.__qualname__}({", ".join(parts)})'
 
-    def __eq__(self, other):
+    def _other_key(self, other):
+        # Return the comparison key, date and time precisions, and
+        # partial flag for other, or None if comparisons with other are
+        # not supported.
+        if isinstance(other, Datetime):
+            return (other._sort_key, other._date_mask, other._time_mask,
+                    other.partial)
         if isinstance(other, datetime.datetime):
-            d = other.date()
-            t = other.time().replace(tzinfo=other.tzinfo)
-            opartial = False
-        elif isinstance(other, Datetime):
-            d = other._date
-            t = other._time
-            opartial = other.partial
+            key = (
+                fd.partialdate.date._sort_key(
+                    other.year, other.month, other.day)
+                << fd.partialdate.time._sort_key_bits
+                | fd.partialdate.time._sort_key(
+                    other.hour, other.minute, other.second,
+                    other.microsecond)
+            )
+            return key, 0b111, 0b111, False
+        return None
+
+    def _zoned(self, other, opartial, verb):
+        # Return comparable values for datetimes with different time
+        # zones.  Only complete values can be converted.
+        if self.partial or opartial:
+            if self.partial and opartial:
+                extra = ''
+            else:
+                extra = ' and complete'
+            raise TypeError(
+                f"can't {verb} partial{extra} datetime values"
+                f" with different time zones")
+        lh = self._get_utc_key()
+        if isinstance(other, Datetime):
+            rh = other._get_utc_key()
         else:
-            return NotImplemented
-
-        if self.tzinfo != other.tzinfo:
-            if self.partial or opartial:
-                # return False
-                if self.partial and opartial:
-                    extra = ''
-                else:
-                    extra = ' and complete'
-                raise TypeError(
-                    f"can't compare partial{extra} datetime values"
-                    f" with different time zones")
-
-            # Values are complete; timezones differ.  Let datetime
-            # figure out equality.
-            lh = datetime.datetime(
-                year=self.year, month=self.month, day=self.day,
-                hour=self.hour, minute=self.minute, second=self.second,
-                microsecond=0, tzinfo=self.tzinfo)
+            rh = _utc_key(other.year, other.month, other.day, other.hour,
+                          other.minute, other.second, other.microsecond,
+                          other.tzinfo)
+        if lh is None or rh is None:
+            # Let datetime figure out the relationship.
+            lh = self._stdlib(0)
             rh = datetime.datetime(
                 year=other.year, month=other.month, day=other.day,
                 hour=other.hour, minute=other.minute, second=other.second,
                 microsecond=getattr(other, 'microsecond', 0),
                 tzinfo=other.tzinfo)
-            return lh == rh
-
-        return self._date == d and self._time == t
+        return lh, rh
 
-    def __lt__(self, other):
-        if isinstance(other, datetime.datetime):
-            d = other.date()
-            t = other.time().replace(tzinfo=other.tzinfo)
-            opartial = False
-        elif isinstance(other, Datetime):
-            d = other._date
-            t = other._time
-            opartial = other.partial
-        else:
+    def _compare(self, other, op):
+        found = self._other_key(other)
+        if found is None:
             ocls = other.__class__
             raise TypeError(
                 f"ordering not supported between instances of"
                 f" '{self.__class__.__name__}' and"
                 f" '{ocls.__module__}.{ocls.__qualname__}'")
+        okey, odmask, otmask, opartial = found
 
-        # Could let this fall through to the datetime comparison below,
-        # but we want to control the message for consistency.
-        tzinfos = [tz for tz in (self.tzinfo, other.tzinfo) if tz is not None]
-        if len(tzinfos) == 1:
+        if (self.tzinfo is None) != (other.tzinfo is None):
             # Referring to offset is odd, but mirrors a similar message
             # from the standard library's datetime implementation.
             raise TypeError(
                 "can't order offset-naive and offset-aware datetime values")
+        if self.tzinfo != other.tzinfo:
+            lh, rh = self._zoned(other, opartial, 'order')
+            return op(lh, rh)
+
+        # The time precision only matters if the dates are equal, since
+        # the time is not considered otherwise.
+        skey = self._sort_key
+        if _leading_fields[self._date_mask] != _leading_fields[odmask]:
+            raise ValueError('ordering not supported between'
+                             ' incompatible partial dates')
+        shift = fd.partialdate.time._sort_key_bits
+        if (_leading_fields[self._time_mask] != _leading_fields[otmask]
+                and skey >> shift == okey >> shift):
+            raise ValueError('ordering not supported between'
+                             ' incompatible partial times')
+        return op(skey, okey)
 
+    def __eq__(self, other):
+        found = self._other_key(other)
+        if found is None:
+            return NotImplemented
         if self.tzinfo != other.tzinfo:
-            if self.partial or opartial:
-                if self.partial and opartial:
-                    extra = ''
-                else:
-                    extra = ' and complete'
-                raise TypeError(
-                    f"can't order partial{extra} datetime values"
-                    f" with different time zones")
-
-            # Values are complete; timezones differ.  Let datetime
-            # figure out equality.
-            lh = datetime.datetime(
-                year=self.year, month=self.month, day=self.day,
-                hour=self.hour, minute=self.minute, second=self.second,
-                microsecond=0, tzinfo=self.tzinfo)
-            rh = datetime.datetime(
-                year=other.year, month=other.month, day=other.day,
-                hour=other.hour, minute=other.minute, second=other.second,
-                microsecond=getattr(other, 'microsecond', 0),
-                tzinfo=other.tzinfo)
-            return lh < rh
+            lh, rh = self._zoned(other, found[3], 'compare')
+            return lh == rh
+        return self._sort_key == found[0]
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        if result is NotImplemented:
+            return result
+        return not result
+
+    def __hash__(self):
+        # Complete datetimes can be equal to standard library datetimes,
+        # or to datetimes in other time zones, so they need to hash the
+        # same way.
+        if self._hash is None:
+            if self.partial:
+                self._hash = hash((self._sort_key, self.tzinfo))
+            else:
+                try:
+                    value = datetime.datetime(
+                        self.year, self.month, self.day,
+                        self.hour, self.minute, self.second,
+                        tzinfo=self.tzinfo)
+                    self._hash = hash(value)
+                except (ValueError, OverflowError):
+                    # Outside the range supported by datetime, so cannot
+                    # be compared across time zones either.
+                    self._hash = hash((self._sort_key, self.tzinfo))
+        return self._hash
 
-        if self._date < d:
-            return True
-        elif self._date == d:
-            return self._time < t
-        else:
-            return False
+    def __lt__(self, other):
+        return self._compare(other, operator.lt)
+
+    def __le__(self, other):
+        return self._compare(other, operator.le)
+
+    def __gt__(self, other):
+        return self._compare(other, operator.gt)
+
+    def __ge__(self, other):
+        return self._compare(other, operator.ge)
 
     def __str__(self) -> str:
         return self.isoformat(sep=' ')
@@ -247,43 +810,197 @@ class Datetime:
         basic format will always be used for partial values.
 
         """
-        if self._date.partial:
-            extended = False
-        time = self._time.isoformat(extended=extended)
+        if self._source is not None:
+            self._reuse_source()
         if extended:
-            extended = ':' in time
-        date = self._date.isoformat(extended=extended)
-        return f'{date}{sep}{time}'
+            text = self._extended_text
+            if text is None:
+                text = self._isoformat(True)
+                self._extended_text = text
+        else:
+            text = self._basic_text
+            if text is None:
+                text = self._isoformat(False)
+                self._basic_text = text
+        if sep != 'T':
+            # The date portion never contains 'T'.
+            text = text.replace('T', sep, 1)
+        return text
+
+    def _isoformat(self, extended):
+        year, month, day = self.year, self.month, self.day
+        hour, minute, second = self.hour, self.minute, self.second
+        dmask = self._date_mask
+        tmask = self._time_mask
+        # The extended format is used for both portions or neither, so
+        # it requires a complete date and at least hours and minutes.
+        extended = extended and dmask == 0b111 and tmask >= 0b110
+        dformatter = fd.partialdate.date._formats[dmask][extended]
+        tformatter, tzsep = fd.partialdate.time._formats[tmask][extended]
+        return (dformatter(year, month, day) + 'T'
+                + tformatter(hour, minute, second)
+                + fd.partialdate.time._tzstr(self.tzinfo, tzsep))
+
+    def _reuse_source(self):
+        # Retain the text the datetime was parsed from, as for dates and
+        # times.  Ordinal dates are not retained.  Given the fields that
+        # are present and the format used, only the canonical form has
+        # 'T' after the date, ends with the canonical zone designator,
+        # and has the right length.
+        text = self._source
+        self._source = None
+        if text[-1:] == '\n' or not fd.partialdate.utils.isascii(text):
+            return
+        dmask = self._date_mask
+        tmask = self._time_mask
+        # Only the extended format uses ':'.
+        extended = ':' in text
+        i = fd.partialdate.date._lengths[dmask][extended]
+        if text[i:i + 1] != 'T':
+            return
+        tzsep = fd.partialdate.time._formats[tmask][extended][1]
+        tzstr = fd.partialdate.time._tzstr(self.tzinfo, tzsep)
+        n = i + 1 + fd.partialdate.time._lengths[tmask][extended]
+        if len(text) != n + len(tzstr) or not text.endswith(tzstr):
+            return
+        if extended or not (dmask == 0b111 and tmask >= 0b110):
+            self._extended_text = text
+        if not extended:
+            self._basic_text = text
 
     @classmethod
-    def isoparse(cls, text: str):
+    def isoparse(cls, text: typing.Union[str, bytes], intern: bool = False):
         """Parse an ISO 8601 basic or extended date representation.
 
-        :param text:  ISO 8601 representation to convert
+        :param text:
+            ISO 8601 representation to convert; may be a :class:`str`
+            or any bytes-like object containing ASCII text
+        :param intern:
+            Return the shared instance for the parsed value, as for
+            :meth:`intern`
 
         Ordinal dates must include the year, and will be converted to
         year-month-day representations assuming the proleptic Gregorian
         calendar.
 
         """
-        m = _rx.match(text)
-        if m is None:
+        cache = cls._parse_cache
+        if cache is not None and cache.owner is cls:
+            value = cache.parse(cls._isoparse, text)
+        else:
+            value = cls._isoparse(text)
+        if intern:
+            value = value._intern()
+        return value
+
+    @classmethod
+    def try_isoparse(cls, text: typing.Union[str, bytes], default=None):
+        """Parse an ISO 8601 datetime representation, or return a default.
+
+        :param text:
+            ISO 8601 representation to convert, as for :meth:`isoparse`
+        :param default:
+            Value to return if the text cannot be converted
+
+        Text that does not have the syntax of a supported format is
+        rejected without an exception being raised, so this is cheaper
+        than handling exceptions from :meth:`isoparse` when many values
+        are malformed.
+
+        """
+        cache = cls._parse_cache
+        if cache is not None and cache.owner is cls:
+            value = cache.parse(cls._try_isoparse, text)
+        else:
+            value = cls._try_isoparse(text)
+        return default if value is None else value
+
+    @classmethod
+    def _try_isoparse(cls, text):
+        text, fields = _decode(text)
+        if fields is None:
+            return None
+        try:
+            return cls._from_decoded(text, fields)
+        except ValueError:
+            return None
+
+    @classmethod
+    def _isoparse(cls, text):
+        text, fields = _decode(text)
+        if fields is None:
             raise fd.partialdate.exceptions.ParseError(
-                'ISO 8601 datetime', text)
-        year, month, day, ordinal = m.group('year', 'month', 'day', 'ordinal')
-        hour, minute, second = m.group('hour', 'minute', 'second')
-        if ordinal is None:
-            if day is None and month == '-':
-                raise fd.partialdate.exceptions.ParseError(
-                    'ISO 8601 datetime', text)
-        year, month, day, ordinal, hour, minute, second = [
-            None if v in ('-', None) else int(v)
-            for v in (year, month, day, ordinal, hour, minute, second)
-        ]
+                'ISO 8601 datetime', fd.partialdate.utils.ascii_text(text))
+        return cls._from_decoded(text, fields)
+
+    @classmethod
+    def _from_decoded(cls, text, fields):
+        year, month, day, ordinal, hour, minute, second, tzstr = fields
         if ordinal is not None:
             month, day = fd.partialdate.date._ordinal2md(
                 'ISO 8601 datetime', text, year, ordinal)
-        tzinfo = fd.partialdate.time._tzinfo(m.group('tzinfo'))
-        return cls(year=year, month=month, day=day,
-                   hour=hour, minute=minute, second=second,
-                   tzinfo=tzinfo)
+        tzinfo = fd.partialdate.time._tzinfo(tzstr)
+        fd.partialdate.date._check(year, month, day)
+        fd.partialdate.time._check(hour, minute, second)
+        self = cls._from_fields(
+            year, month, day, hour, minute, second, tzinfo)
+        if ordinal is None and text.__class__ is str:
+            self._source = text
+        return self
+
+    @classmethod
+    def isoparse_many(cls, values, errors: str = 'raise'):
+        """Parse a sequence of ISO 8601 datetime representations.
+
+        :param values:  Iterable of ISO 8601 representations to convert
+        :param errors:
+            How values that cannot be converted are handled:
+            ``'raise'`` propagates the exception, ``'skip'`` omits the
+            value, ``'none'`` substitutes ``None``, and ``'collect'``
+            substitutes ``None`` and records the failure.
+
+        A list of converted values is returned.  For ``'collect'``, a
+        second list is returned as well, containing pairs of the
+        position of each failing value and the exception describing
+        the failure.
+
+        """
+        return fd.partialdate.utils.parse_many(
+            cls.isoparse, cls.try_isoparse, values, errors)
+
+    @classmethod
+    def isoformat_many(cls, values, extended: bool = True,
+                       sep: str = 'T') -> typing.List[str]:
+        """Return ISO 8601 representations of a sequence of datetimes.
+
+        :param values:  Iterable of datetimes to format
+        :param extended:
+            Prefer the extended format, if applicable for each value
+        :param sep:  Separator to use between date and time
+
+        """
+        return list(map(
+            functools.partial(cls.isoformat, sep=sep, extended=extended),
+            values))
+
+    @classmethod
+    def write_iso(cls, values, fileobj, terminator: str = '\n',
+                  extended: bool = True, sep: str = 'T') -> int:
+        """Write ISO 8601 representations of datetimes to a file.
+
+        :param values:  Iterable of datetimes to format
+        :param fileobj:
+            Text or binary file object to write to; binary file objects
+            receive ASCII-encoded text
+        :param terminator:  Text written after each value
+        :param extended:
+            Prefer the extended format, if applicable for each value
+        :param sep:  Separator to use between date and time
+
+        Values are written in batches rather than individually.  The
+        number of values written is returned.
+
+        """
+        return fd.partialdate.utils.write_formatted(
+            functools.partial(cls.isoformat, sep=sep, extended=extended),
+            values, fileobj, terminator)
@@ -6,9 +6,6 @@ Exceptions defined for :mod:`fd.partialdate`.
 
 class ParseError(ValueError):
 
-    message: str
-    """User-facing message describing the error."""
-
     what: str
     """Identifier of what was being parsed (example: ``'ISO 8601 date'``)."""
 
@@ -18,9 +15,24 @@ class ParseError(ValueError):
     def __init__(self, what: str, value: str):
         self.what = what
         self.value = value
-        self.message = f'text cannot be parsed as an {what}: {value!r}'
         super(ParseError, self).__init__(what, value)
 
+    _message = None
+
+    @property
+    def message(self) -> str:
+        """User-facing message describing the error."""
+        # Computed when first needed, since many errors are discarded
+        # without being reported.
+        if self._message is None:
+            self._message = (
+                f'text cannot be parsed as an {self.what}: {self.value!r}')
+        return self._message
+
+    @message.setter
+    def message(self, message: str):
+        self._message = message
+
     def __str__(self):
         return self.message
 
@@ -30,9 +42,6 @@ class RangeError(ValueError):
     field: str
     """Name of the input fields that's outside the allowed range."""
 
-    message: str
-    """User-facing message describing the error."""
-
     value: int
     """Provided value of the field."""
 
@@ -47,8 +56,24 @@ class RangeError(ValueError):
         self.value = value
         self.min = min
         self.max = max
-        self.message = f'{field} is out of range [{min}..{max}]: {value}'
         super(RangeError, self).__init__(field, value, min, max)
 
+    _message = None
+
+    @property
+    def message(self) -> str:
+        """User-facing message describing the error."""
+        # Computed when first needed, since many errors are discarded
+        # without being reported.
+        if self._message is None:
+            self._message = (
+                f'{self.field} is out of range [{self.min}..{self.max}]:'
+                f' {self.value}')
+        return self._message
+
+    @message.setter
+    def message(self, message: str):
+        self._message = message
+
     def __str__(self):
         return self.message
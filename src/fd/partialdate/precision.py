@@ -0,0 +1,58 @@
+"""\
+Identification of the fields present in partial values.
+
+"""
+
+import enum
+
+
+class Precision(enum.Enum):
+    """Combination of fields present in a date or time.
+
+    Date and time fields are described separately; a datetime has one
+    of each.
+
+    """
+
+    YEAR = 'year'
+    YEAR_MONTH = 'year-month'
+    DATE = 'date'
+    MONTH_DAY = 'month-day'
+    DAY = 'day'
+
+    HOUR = 'hour'
+    HOUR_MINUTE = 'hour-minute'
+    TIME = 'time'
+    MINUTE_SECOND = 'minute-second'
+    SECOND = 'second'
+
+
+# Precisions indexed by the bit mask of the fields present, with the
+# most-significant field in the highest bit; combinations of fields
+# that are not allowed have None.
+date_precisions = (
+    None,
+    Precision.DAY,
+    None,
+    Precision.MONTH_DAY,
+    Precision.YEAR,
+    None,
+    Precision.YEAR_MONTH,
+    Precision.DATE,
+)
+
+time_precisions = (
+    None,
+    Precision.SECOND,
+    None,
+    Precision.MINUTE_SECOND,
+    Precision.HOUR,
+    None,
+    Precision.HOUR_MINUTE,
+    Precision.TIME,
+)
+
+# Position of the most-significant field present, indexed by the same
+# bit masks for both dates and times.  Partial values can only be
+# ordered against values having the same leading field.
+leading_fields = (None, 2, None, 1, 0, None, 0, 0)
@@ -0,0 +1,60 @@
+"""\
+Lazy conversion of line-oriented ISO 8601 data.
+
+Values are converted one at a time as they are consumed, so files of
+any size can be processed in constant memory.
+
+"""
+
+import fd.partialdate.datetime
+
+
+def iparse(lines, kind=fd.partialdate.datetime.Datetime,
+           errors: str = 'raise'):
+    """Generate parsed values from an iterable of lines.
+
+    :param lines:
+        Iterable of :class:`str` or bytes-like lines, such as an open
+        file.  A trailing line terminator is removed from each
+        line before it is parsed.
+    :param kind:
+        Class used to parse each line; :class:`~fd.partialdate.date.Date`,
+        :class:`~fd.partialdate.time.Time`, or
+        :class:`~fd.partialdate.datetime.Datetime`.
+    :param errors:
+        How lines that cannot be converted are handled: ``'raise'``
+        propagates the exception, ``'skip'`` omits the value, and
+        ``'none'`` generates ``None`` in place of the value.
+
+    Exceptions are the same as those raised by the ``isoparse`` method
+    of `kind`.  Except for ``'raise'``, lines that are not text or
+    bytes-like, such as ``None``, are handled the same way as lines
+    that cannot be parsed.
+
+    """
+    if errors not in ('raise', 'skip', 'none'):
+        raise ValueError(f'unknown error policy: {errors!r}')
+    if errors == 'raise':
+        return map(kind.isoparse, map(_strip, lines))
+    return _iparse(lines, kind.try_isoparse, errors == 'none')
+
+
+def _strip(line):
+    if isinstance(line, str):
+        if line[-1:] == '\n':
+            line = line[:-2] if line[-2:] == '\r\n' else line[:-1]
+    elif line[-1:] == b'\n':
+        line = line[:-2] if line[-2:] == b'\r\n' else line[:-1]
+    return line
+
+
+def _iparse(lines, try_parse, keep_failures):
+    # try_parse rejects unparsable lines without creating an exception;
+    # only lines that are not text or bytes-like raise.
+    for line in lines:
+        try:
+            value = try_parse(_strip(line))
+        except (ValueError, TypeError):
+            value = None
+        if value is not None or keep_failures:
+            yield value
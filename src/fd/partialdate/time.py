@@ -12,9 +12,11 @@ specified or omitted.
 
 import datetime
 import functools
+import operator
 import typing
 
 import fd.partialdate.exceptions
+import fd.partialdate.precision
 import fd.partialdate.utils
 
 
@@ -54,43 +56,233 @@ _re_extended = r"""
     (?P<tzinfo>[zZ]|[-+]\d{2}|[-+]\d{2}:\d{2})?
     $
 """
+
+
+def _select(text):
+    # Only the last alternative allows a leading '-', and only the
+    # first allows ':'.
+    if text[:1] == '-':
+        return (2,)
+    if text[2:3] == ':':
+        return (0,)
+    return (1,)
+
+
 _rx = fd.partialdate.utils.RegularExpressionGroup(
     _re_extended,
     _re_basic_1,
     _re_basic_2,
+    names=('hour', 'minute', 'second', 'tzinfo'),
+    select=_select,
 )
 
 
+def _match(text):
+    """Decode time fields using the regular expressions.
+
+    This is the reference implementation for :func:`_scan`; it returns
+    the same results, but is considerably slower.
+
+    """
+    found = _rx.match(text)
+    if found is None:
+        return None
+    alternative, (hour, minute, second, tzstr) = found
+    if alternative == 2:
+        # Only the last alternative allows '-' placeholders.
+        hour = None
+        if minute == '-':
+            minute = None
+    hour, minute, second = [
+        None if v is None else int(v)
+        for v in (hour, minute, second)
+    ]
+    return hour, minute, second, tzstr
+
+
+def _scanner(newline, dash, plus, colon, zulu, isdigits, tztext):
+    # Create scanners for either str or bytes; the constants and the
+    # digit test must match the type of text to be scanned.  tztext
+    # converts a zone designator to str, if needed.
+
+    def _scan_tz(tzstr, extended):
+        """Determine whether a zone designator is syntactically valid.
+
+        An empty string is accepted, indicating no zone designator.
+
+        """
+        n = len(tzstr)
+        if n == 0:
+            return True
+        if n == 1:
+            return tzstr in zulu
+        sign = tzstr[:1]
+        if sign != plus and sign != dash:
+            return False
+        if n == 3:
+            return isdigits(tzstr[1:])
+        if extended:
+            return (n == 6 and tzstr[3:4] == colon
+                    and isdigits(tzstr[1:3]) and isdigits(tzstr[4:]))
+        return n == 5 and isdigits(tzstr[1:])
+
+    def _scan(text):
+        """Decode time fields from text without regular expressions.
+
+        Returns a tuple of hour, minute, second, and zone designator (or
+        ``None``), or ``None`` if the text does not have the syntax of a
+        supported time format.  Range checks are left to the caller.
+
+        """
+        if text[-1:] == newline:
+            # The regular expressions accept a single trailing newline
+            # since ``$`` matches just before it; we need to do the same.
+            text = text[:-1]
+        n = len(text)
+        hour = minute = second = None
+        if text[2:3] == colon:
+            # hh:mm, hh:mm:ss
+            if n < 5 or not (isdigits(text[:2]) and isdigits(text[3:5])):
+                return None
+            hour = int(text[:2])
+            minute = int(text[3:5])
+            if text[5:6] == colon:
+                if n < 8 or not isdigits(text[6:8]):
+                    return None
+                second = int(text[6:8])
+                tzstr = text[8:]
+            else:
+                tzstr = text[5:]
+            extended = True
+        elif text[:1] == dash:
+            # -mmss, --ss
+            if text[1:2] == dash:
+                if n < 4 or not isdigits(text[2:4]):
+                    return None
+                second = int(text[2:4])
+                tzstr = text[4:]
+            else:
+                if n < 5 or not isdigits(text[1:5]):
+                    return None
+                minute = int(text[1:3])
+                second = int(text[3:5])
+                tzstr = text[5:]
+            extended = False
+        else:
+            # hh, hhmm, hhmmss
+            if n < 2 or not isdigits(text[:2]):
+                return None
+            hour = int(text[:2])
+            if n >= 4 and isdigits(text[2:4]):
+                minute = int(text[2:4])
+                if n >= 6 and isdigits(text[4:6]):
+                    second = int(text[4:6])
+                    tzstr = text[6:]
+                else:
+                    tzstr = text[4:]
+            else:
+                tzstr = text[2:]
+            extended = False
+        if not tzstr:
+            tzstr = None
+        elif not _scan_tz(tzstr, extended):
+            return None
+        elif tztext is not None:
+            tzstr = tztext(tzstr)
+        return hour, minute, second, tzstr
+
+    return _scan, _scan_tz
+
+
+_scan, _scan_tz = _scanner(
+    '\n', '-', '+', ':', ('Z', 'z'), str.isdecimal, None)
+_scan_bytes, _scan_tz_bytes = _scanner(
+    b'\n', b'-', b'+', b':', (b'Z', b'z'), bytes.isdigit, bytes.decode)
+
+
+# The hand-written scanner is used by default; the regular expressions
+# are retained as a reference implementation, and may be selected by
+# assigning _match here.
+_parse_fields = _scan
+
+
+def _decode(text):
+    # Return the text, converted to bytes if not a str, and the decoded
+    # fields, or None if the text does not have a supported syntax.
+    if isinstance(text, str):
+        return text, _parse_fields(text)
+    text = fd.partialdate.utils.ascii_bytes(text)
+    return text, _scan_bytes(text)
+
+
+_d2 = fd.partialdate.utils.two_digits
+
+# Time zones for parsed zone designators are shared; they are cached by
+# designator and by offset in minutes, so different designators for the
+# same offset produce the same object.  Only a limited number of
+# designators are retained, since digits other than ASCII digits are
+# accepted as well.
+_tzinfo_by_designator = {}
+_tzinfo_by_designator_size = 1024
+_timezones = {0: datetime.timezone.utc}
+
+# Formatted zone designators for datetime.timezone instances, keyed by
+# time zone and separator.
+_tzstr_by_timezone = {}
+
+
 def _tzinfo(tzstr=None):
     if tzstr is None:
-        tzinfo = None
-    elif tzstr in ('z', 'Z'):
-        tzinfo = datetime.timezone.utc
-    elif len(tzstr) == 3:
-        if tzstr in ('-00', '+00'):
-            tzinfo = datetime.timezone.utc
-        else:
-            offset = datetime.timedelta(hours=int(tzstr))
-            tzinfo = datetime.timezone(offset)
-    else:
-        if ':' in tzstr:
-            tzstr = tzstr.replace(':', '')
-        assert len(tzstr) == 5, repr(tzstr)
-        if tzstr in ('-0000', '+0000'):
-            tzinfo = datetime.timezone.utc
-        else:
-            hours = int(tzstr[1:3])
-            minutes = int(tzstr[3:])
-            offset = datetime.timedelta(hours=hours, minutes=minutes)
-            if tzstr[0] == '-':
-                offset = -offset
-            tzinfo = datetime.timezone(offset)
+        return None
+    tzinfo = _tzinfo_by_designator.get(tzstr)
+    if tzinfo is None:
+        tzinfo = _timezone(_offset_minutes(tzstr))
+        if len(_tzinfo_by_designator) < _tzinfo_by_designator_size:
+            _tzinfo_by_designator[tzstr] = tzinfo
+    return tzinfo
+
+
+def _offset_minutes(tzstr):
+    if tzstr in ('z', 'Z'):
+        return 0
+    if len(tzstr) == 3:
+        return int(tzstr) * 60
+    # Either +hhmm or +hh:mm; only the sign, hours, and minutes
+    # matter.
+    assert len(tzstr) in (5, 6), repr(tzstr)
+    minutes = int(tzstr[1:3]) * 60 + int(tzstr[-2:])
+    if tzstr[0] == '-':
+        minutes = -minutes
+    return minutes
+
+
+def _timezone(minutes):
+    """Return the shared time zone for an offset in minutes.
+
+    Raises ValueError if the offset is not less than a day.
+
+    """
+    tzinfo = _timezones.get(minutes)
+    if tzinfo is None:
+        tzinfo = datetime.timezone(datetime.timedelta(minutes=minutes))
+        _timezones[minutes] = tzinfo
     return tzinfo
 
 
 def _tzstr(tzinfo, sep):
     if tzinfo is None:
         return ''
+    # Other tzinfo implementations may not have a fixed offset.
+    if tzinfo.__class__ is not datetime.timezone:
+        return _format_offset(tzinfo, sep)
+    tzstr = _tzstr_by_timezone.get((tzinfo, sep))
+    if tzstr is None:
+        tzstr = _format_offset(tzinfo, sep)
+        _tzstr_by_timezone[tzinfo, sep] = tzstr
+    return tzstr
+
+
+def _format_offset(tzinfo, sep):
     seconds = int(tzinfo.utcoffset(None).total_seconds())
     if seconds < 0:
         seconds = -seconds
@@ -105,18 +297,173 @@ def _tzstr(tzinfo, sep):
     if hours == minutes == 0:
         return 'Z'
     else:
-        return f'{sign}{hours:02}{sep}{minutes:02}'
+        return sign + _d2[hours] + sep + _d2[minutes]
+
+
+def _check(hour, minute, second):
+    """Raise ValueError if the fields do not describe a valid time."""
+    if hour is None and second is None:
+        if minute:
+            raise ValueError(
+                'must specify hour or second along with minute')
+        else:
+            raise ValueError('must specify hour or second')
+    if hour is not None:
+        if not (0 <= hour <= 23):
+            raise fd.partialdate.exceptions.RangeError(
+                'hour', hour, 0, 23)
+    if minute is None:
+        if hour is not None and second is not None:
+            raise ValueError(
+                'cannot specify hour and second without minute')
+        if second is not None:
+            if not (0 <= second <= 59):
+                raise fd.partialdate.exceptions.RangeError(
+                    'second', second, 0, 59)
+    else:
+        if not (0 <= minute <= 59):
+            raise fd.partialdate.exceptions.RangeError(
+                'minute', minute, 0, 59)
+        if second is not None:
+            if not (0 <= second <= 59):
+                raise fd.partialdate.exceptions.RangeError(
+                    'second', second, 0, 59)
+
+
+def _valid(hour, minute, second):
+    """Return true if :func:`_check` accepts the fields.
+
+    Used when only validity is needed, so no exception is created.
+
+    """
+    if hour is None:
+        if second is None:
+            return False
+    elif not (0 <= hour <= 23):
+        return False
+    if minute is None:
+        if second is None:
+            return True
+        return hour is None and 0 <= second <= 59
+    if not (0 <= minute <= 59):
+        return False
+    return second is None or 0 <= second <= 59
+
+
+def _valid_tz(tzstr):
+    """Return true if :func:`_tzinfo` accepts the zone designator."""
+    return tzstr is None or -1440 < _offset_minutes(tzstr) < 1440
+
+
+Precision = fd.partialdate.precision.Precision
+
+_precisions = fd.partialdate.precision.time_precisions
+_leading_fields = fd.partialdate.precision.leading_fields
+
+# Number of bits used by the values returned by _sort_key.
+_sort_key_bits = 39
+
+
+def _sort_key(hour, minute, second, microsecond=0, leading=0):
+    """Pack time fields into an integer that orders like the fields.
+
+    Present fields other than the microseconds are offset by one so that
+    missing fields, encoded as zero, order before all present values.
+    The position of the leading field is placed in the most-significant
+    bits.
+
+    """
+    return (
+        leading << 37
+        | (0 if hour is None else hour + 1) << 32
+        | (0 if minute is None else minute + 1) << 26
+        | (0 if second is None else second + 1) << 20
+        | microsecond
+    )
+
+
+# The constructors build keys inline rather than calling _sort_key,
+# adding up the contributions of the fields from these tables.
+_hour_keys = tuple((hour + 1) << 32 for hour in range(24))
+_minute_keys = tuple((minute + 1) << 26 for minute in range(60))
+_second_keys = tuple((second + 1) << 20 for second in range(60))
+
+_complete = _precisions[0b111]
+_new = object.__new__
+
+
+_second = datetime.timedelta(seconds=1)
+
+
+def _utc_key(hour, minute, second, microsecond, tzinfo):
+    """Pack an aware time into an integer that orders like UTC times.
+
+    The result orders like comparisons of aware :class:`datetime.time`
+    values: the offset is taken in whole seconds, and the time is not
+    reduced modulo a day.  ``None`` is returned unless the time zone is
+    a :class:`datetime.timezone`, which is known to have a fixed, valid
+    offset.
+
+    """
+    if tzinfo.__class__ is not datetime.timezone:
+        return None
+    offset = tzinfo.utcoffset(None) // _second
+    return ((hour * 3600 + minute * 60 + second - offset) * 1000000
+            + microsecond)
+
+
+# Formatters indexed by the bit mask of the fields present (hour,
+# minute, second, from most-significant); each entry holds the formatter
+# and zone designator separator for the basic and extended formats.  The
+# extended format is only distinct if the hour and minute are both
+# present, which is the case for masks of 0b110 and above.
+_formats = (
+    None,
+    ((lambda h, m, s: '--' + _d2[s], ''),) * 2,
+    None,
+    ((lambda h, m, s: '-' + _d2[m] + _d2[s], ''),) * 2,
+    ((lambda h, m, s: _d2[h], ''),) * 2,
+    None,
+    ((lambda h, m, s: _d2[h] + _d2[m], ''),
+     (lambda h, m, s: _d2[h] + ':' + _d2[m], ':')),
+    ((lambda h, m, s: _d2[h] + _d2[m] + _d2[s], ''),
+     (lambda h, m, s: _d2[h] + ':' + _d2[m] + ':' + _d2[s], ':')),
+)
+
+
+# Lengths of the values produced by the formatters, without the zone
+# designator.
+_lengths = tuple(
+    None if formatters is None
+    else tuple(len(formatter(0, 0, 0)) for formatter, sep in formatters)
+    for formatters in _formats
+)
+
+
+def _mask(hour, minute, second):
+    return ((hour is not None) << 2
+            | (minute is not None) << 1
+            | (second is not None))
 
 
-@functools.total_ordering
-class Time:
+def _isoformat(mask, hour, minute, second, tzinfo, extended):
+    """Format time fields; see :meth:`Time.isoformat`."""
+    formatter, sep = _formats[mask][bool(extended)]
+    return formatter(hour, minute, second) + _tzstr(tzinfo, sep)
+
+
+class Time(fd.partialdate.utils.ParseCaching):
     """Date representation supporting partial values.
 
     Leap seconds are not supported.
 
     """
 
-    __slots__ = 'hour', 'minute', 'second', 'tzinfo', 'partial'
+    __slots__ = (
+        'hour', 'minute', 'second', 'tzinfo', 'partial',
+        'precision', '_mask', '_sort_key', '_utc_key', '_hash',
+        '_basic_text', '_extended_text', '_source', '__weakref__',
+    )
 
     hour: typing.Optional[int]
     """Hour of day, or ``None``."""
@@ -133,40 +480,121 @@ class Time:
     partial: bool
     """Indicates whether the value is partial (``True``) or complete."""
 
+    precision: Precision
+    """Fields present in the value."""
+
     def __init__(self, hour=None, minute=None, second=None, tzinfo=None):
-        if hour is None and second is None:
-            if minute:
-                raise ValueError(
-                    'must specify hour or second along with minute')
-            else:
-                raise ValueError('must specify hour or second')
-        if hour is not None:
-            if not (0 <= hour <= 23):
-                raise fd.partialdate.exceptions.RangeError(
-                    'hour', hour, 0, 23)
-        if minute is None:
-            if hour is not None and second is not None:
-                raise ValueError(
-                    'cannot specify hour and second without minute')
-            if second is not None:
-                if not (0 <= second <= 59):
-                    raise fd.partialdate.exceptions.RangeError(
-                        'second', second, 0, 59)
+        _check(hour, minute, second)
+        # Fields and keys are set inline here and in _from_fields, since
+        # construction is a large part of parsing.
+        self.hour = hour
+        self.minute = minute
+        self.second = second
+        self.tzinfo = tzinfo
+        if hour is not None and second is not None:
+            # Complete, so the minute is present too.
+            self.partial = False
+            self.precision = _complete
+            self._mask = 0b111
+            self._sort_key = (
+                _hour_keys[hour] + _minute_keys[minute] + _second_keys[second])
         else:
-            if not (0 <= minute <= 59):
-                raise fd.partialdate.exceptions.RangeError(
-                    'minute', minute, 0, 59)
+            mask = key = 0
+            if hour is not None:
+                mask = 0b100
+                key = _hour_keys[hour]
+            if minute is not None:
+                mask |= 0b010
+                key |= _minute_keys[minute]
             if second is not None:
-                if not (0 <= second <= 59):
-                    raise fd.partialdate.exceptions.RangeError(
-                        'second', second, 0, 59)
+                mask |= 0b001
+                key |= _second_keys[second]
+            self.partial = True
+            self.precision = _precisions[mask]
+            self._mask = mask
+            self._sort_key = _leading_fields[mask] << 37 | key
+        self._utc_key = None
+        self._hash = None
+        self._basic_text = None
+        self._extended_text = None
+        self._source = None
+
+    @classmethod
+    def _from_fields(cls, hour, minute, second, tzinfo):
+        """Construct a time from fields that have already been checked."""
+        self = _new(cls)
         self.hour = hour
         self.minute = minute
         self.second = second
         self.tzinfo = tzinfo
-        # No need to check minute since if minute is None, at least one of
-        # hour or second must be None.
-        self.partial = hour is None or second is None
+        if hour is not None and second is not None:
+            # Complete, so the minute is present too.
+            self.partial = False
+            self.precision = _complete
+            self._mask = 0b111
+            self._sort_key = (
+                _hour_keys[hour] + _minute_keys[minute] + _second_keys[second])
+        else:
+            mask = key = 0
+            if hour is not None:
+                mask = 0b100
+                key = _hour_keys[hour]
+            if minute is not None:
+                mask |= 0b010
+                key |= _minute_keys[minute]
+            if second is not None:
+                mask |= 0b001
+                key |= _second_keys[second]
+            self.partial = True
+            self.precision = _precisions[mask]
+            self._mask = mask
+            self._sort_key = _leading_fields[mask] << 37 | key
+        self._utc_key = None
+        self._hash = None
+        self._basic_text = None
+        self._extended_text = None
+        self._source = None
+        return self
+
+    @classmethod
+    def intern(cls, hour=None, minute=None, second=None, tzinfo=None):
+        """Return a shared instance representing the specified time.
+
+        Repeated calls with the same fields return the same object for
+        as long as it remains referenced elsewhere, as do calls to
+        :meth:`isoparse` with *intern* set.  Equal time zones are not
+        distinguished.
+
+        """
+        key = (cls, hour, minute, second, tzinfo)
+        value = fd.partialdate.utils.interned(key)
+        if value is None:
+            value = cls(hour, minute, second, tzinfo)._intern()
+        return value
+
+    def _intern(self):
+        return fd.partialdate.utils.intern(
+            (self.__class__, self.hour, self.minute, self.second,
+             self.tzinfo),
+            self)
+
+    def __reduce__(self):
+        # Rebuild from the fields, so cached hashes and text are not
+        # pickled; hashes of complete values vary between processes.
+        return self.__class__, (
+            self.hour, self.minute, self.second, self.tzinfo)
+
+    def sort_key(self) -> int:
+        """Return an integer that orders the same way as the time.
+
+        This is suitable as the *key* for :func:`sorted` and similar
+        functions.  Values of differing precision, which cannot be
+        ordered against each other, are grouped by precision, with
+        values including the hour first and second-only values last.
+        Time zones are not considered.
+
+        """
+        return self._sort_key
 
     def __repr__(self):
         cls = self.__class__
@@ -189,147 +617,118 @@ class Time:
 
         return f'{cls.__module__}.{cls.__qualname__}({", ".join(parts)})'
 
-    def __eq__(self, other):
+    def _other_key(self, other, action):
+        # Return the comparison key and precision for other, or None if
+        # comparisons with other are not supported.
+        if isinstance(other, Time):
+            return other._sort_key, other._mask
         if isinstance(other, datetime.datetime):
             ocls = other.__class__
             raise TypeError(
-                f"comparison not supported between instances of"
+                f"{action} not supported between instances of"
                 f" '{self.__class__.__name__}' and"
                 f" '{ocls.__module__}.{ocls.__qualname__}'")
         if isinstance(other, datetime.time):
-            odata = (
-                other.hour,
-                other.minute,
-                other.second,
-                other.microsecond,
-                other.tzinfo,
-            )
-        elif isinstance(other, Time):
-            odata = (
-                -1 if other.hour is None else other.hour,
-                -1 if other.minute is None else other.minute,
-                -1 if other.second is None else other.second,
-                0,
-                other.tzinfo,
-            )
+            key = _sort_key(
+                other.hour, other.minute, other.second, other.microsecond)
+            return key, 0b111
+        return None
+
+    def _zoned(self, other, verb):
+        # Return comparable values for times with different time zones.
+        # Only complete values can be converted.
+        opartial = getattr(other, 'partial', False)
+        if self.partial or opartial:
+            if self.partial and opartial:
+                extra = ''
+            else:
+                extra = ' and complete'
+            raise TypeError(
+                f"can't {verb} partial{extra} time values"
+                f" with different time zones")
+        lh = self._utc_key
+        if lh is None:
+            lh = _utc_key(
+                self.hour, self.minute, self.second, 0, self.tzinfo)
+            self._utc_key = lh
+        if isinstance(other, Time):
+            rh = other._utc_key
+            if rh is None:
+                rh = _utc_key(
+                    other.hour, other.minute, other.second, 0, other.tzinfo)
+                other._utc_key = rh
         else:
-            return NotImplemented
-
-        if self.tzinfo != other.tzinfo:
-            opartial = getattr(other, 'partial', False)
-            if self.partial or opartial:
-                if self.partial and opartial:
-                    extra = ''
-                else:
-                    extra = ' and complete'
-                raise TypeError(
-                    f"can't compare partial{extra} time values"
-                    f" with different time zones")
-
-            # Values are complete; timezones differ.  Let datetime
-            # figure out equality.
+            rh = _utc_key(
+                other.hour, other.minute, other.second, other.microsecond,
+                other.tzinfo)
+        if lh is None or rh is None:
+            # Let datetime figure out the relationship.
             lh = datetime.time(
                 hour=self.hour, minute=self.minute, second=self.second,
-                microsecond=0, tzinfo=self.tzinfo)
+                tzinfo=self.tzinfo)
             rh = datetime.time(
                 hour=other.hour, minute=other.minute, second=other.second,
-                microsecond=odata[-2], tzinfo=other.tzinfo)
-            return lh == rh
-
-        sdata = (
-            -1 if self.hour is None else self.hour,
-            -1 if self.minute is None else self.minute,
-            -1 if self.second is None else self.second,
-            0,
-            self.tzinfo,
-        )
-        return sdata == odata
+                microsecond=getattr(other, 'microsecond', 0),
+                tzinfo=other.tzinfo)
+        return lh, rh
 
-    def __lt__(self, other):
-        if isinstance(other, datetime.datetime):
-            ocls = other.__class__
-            raise TypeError(
-                f"ordering not supported between instances of"
-                f" '{self.__class__.__name__}' and"
-                f" '{ocls.__module__}.{ocls.__qualname__}'")
-        if isinstance(other, datetime.time):
-            odata = (
-                other.hour,
-                other.minute,
-                other.second,
-                other.microsecond,
-                other.tzinfo,
-            )
-            oparts = True, True, True, True
-        elif isinstance(other, Time):
-            odata = (
-                -1 if other.hour is None else other.hour,
-                -1 if other.minute is None else other.minute,
-                -1 if other.second is None else other.second,
-                0,
-                other.tzinfo,
-            )
-            oparts = (
-                other.hour is not None,
-                other.minute is not None,
-                other.second is not None,
-                True,
-            )
-        else:
+    def _compare(self, other, op):
+        found = self._other_key(other, 'ordering')
+        if found is None:
             return NotImplemented
-
-        tzinfos = [tz for tz in (self.tzinfo, other.tzinfo) if tz is not None]
-        if len(tzinfos) == 1:
+        okey, omask = found
+        if (self.tzinfo is None) != (other.tzinfo is None):
             # Referring to offset is odd, but mirrors a similar message
             # from the standard library's datetime implementation.
             raise TypeError(
                 "can't order offset-naive and offset-aware time values")
+        # Values can be ordered if they start with the same field.
+        if _leading_fields[self._mask] != _leading_fields[omask]:
+            raise ValueError('ordering not supported between'
+                             ' incompatible partial times')
+        if self.tzinfo != other.tzinfo:
+            lh, rh = self._zoned(other, 'order')
+            return op(lh, rh)
+        return op(self._sort_key, okey)
 
-        sparts = (
-            self.hour is not None,
-            self.minute is not None,
-            self.second is not None,
-            True,
-        )
-        if False in sparts or False in oparts:
-            # No need to check for ValueError; every case will include
-            # at least one True value since we disallow completely
-            # unspecified values.
-            oprecision = oparts.index(True)
-            sprecision = sparts.index(True)
-            if oprecision != sprecision:
-                raise ValueError('ordering not supported between'
-                                 ' incompatible partial times')
-
-        if tzinfos and tzinfos[0] != tzinfos[1]:
-            assert len(tzinfos) == 2
-            opartial = getattr(other, 'partial', False)
-            if self.partial or opartial:
-                if self.partial and opartial:
-                    extra = ''
-                else:
-                    extra = ' and complete'
-                raise TypeError(
-                    f"can't order partial{extra} time values"
-                    f" with different time zones")
-            # Values are complete; timezones differ.  Let datetime
-            # figure out the order.
-            lh = datetime.time(
-                hour=self.hour, minute=self.minute, second=self.second,
-                tzinfo=self.tzinfo)
-            rh = datetime.time(
-                hour=other.hour, minute=other.minute, second=other.second,
-                tzinfo=other.tzinfo)
-            return lh < rh
+    def __eq__(self, other):
+        found = self._other_key(other, 'comparison')
+        if found is None:
+            return NotImplemented
+        if self.tzinfo != other.tzinfo:
+            lh, rh = self._zoned(other, 'compare')
+            return lh == rh
+        return self._sort_key == found[0]
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        if result is NotImplemented:
+            return result
+        return not result
+
+    def __hash__(self):
+        # Complete times can be equal to standard library times, or to
+        # times in other time zones, so they need to hash the same way.
+        if self._hash is None:
+            if self.partial:
+                self._hash = hash((self._sort_key, self.tzinfo))
+            else:
+                self._hash = hash(datetime.time(
+                    self.hour, self.minute, self.second,
+                    tzinfo=self.tzinfo))
+        return self._hash
+
+    def __lt__(self, other):
+        return self._compare(other, operator.lt)
+
+    def __le__(self, other):
+        return self._compare(other, operator.le)
+
+    def __gt__(self, other):
+        return self._compare(other, operator.gt)
 
-        sdata = (
-            -1 if self.hour is None else self.hour,
-            -1 if self.minute is None else self.minute,
-            -1 if self.second is None else self.second,
-            0,
-            self.tzinfo,
-        )
-        return sdata < odata
+    def __ge__(self, other):
+        return self._compare(other, operator.ge)
 
     def isoformat(self, extended=True):
         """Return an ISO 8601 formatted version of the time.
@@ -341,33 +740,165 @@ class Time:
         basic format will always be used for partial values.
 
         """
-        parts = [
-            (f'{self.hour:02}' if self.hour is not None else '-'),
-            (f'{self.minute:02}' if self.minute is not None else '-'),
-            (f'{self.second:02}' if self.second is not None else '-'),
-        ]
-        if parts[2] == '-':
-            del parts[2]
-        if '-' in parts or not extended:
-            sep = ''
+        if self._source is not None:
+            self._reuse_source()
+        if extended:
+            text = self._extended_text
+            if text is None:
+                text = _isoformat(
+                    self._mask, self.hour, self.minute, self.second,
+                    self.tzinfo, True)
+                self._extended_text = text
         else:
-            sep = ':'
-        return sep.join(parts).rstrip('-') + _tzstr(self.tzinfo, sep)
+            text = self._basic_text
+            if text is None:
+                text = _isoformat(
+                    self._mask, self.hour, self.minute, self.second,
+                    self.tzinfo, False)
+                self._basic_text = text
+        return text
+
+    def _reuse_source(self):
+        # Retain the text the time was parsed from, as for dates.  Given
+        # the fields that are present and the format used, only the
+        # canonical form ends with the canonical zone designator and has
+        # the right length.
+        text = self._source
+        self._source = None
+        if text[-1:] == '\n' or not fd.partialdate.utils.isascii(text):
+            return
+        mask = self._mask
+        # Only the extended format uses ':'.
+        extended = ':' in text
+        tzstr = _tzstr(self.tzinfo, _formats[mask][extended][1])
+        if (len(text) != _lengths[mask][extended] + len(tzstr)
+                or not text.endswith(tzstr)):
+            return
+        if extended or mask < 0b110:
+            self._extended_text = text
+        if not extended:
+            self._basic_text = text
 
     @classmethod
-    def isoparse(cls, text: str):
+    def isoparse(cls, text: typing.Union[str, bytes], intern: bool = False):
         """Parse an ISO 8601 basic time representation.
 
-        :param text:  ISO 8601 representation to convert
+        :param text:
+            ISO 8601 representation to convert; may be a :class:`str`
+            or any bytes-like object containing ASCII text
+        :param intern:
+            Return the shared instance for the parsed value, as for
+            :meth:`intern`
 
         """
-        m = _rx.match(text)
-        if m is None:
+        cache = cls._parse_cache
+        if cache is not None and cache.owner is cls:
+            value = cache.parse(cls._isoparse, text)
+        else:
+            value = cls._isoparse(text)
+        if intern:
+            value = value._intern()
+        return value
+
+    @classmethod
+    def try_isoparse(cls, text: typing.Union[str, bytes], default=None):
+        """Parse an ISO 8601 time representation, or return a default.
+
+        :param text:
+            ISO 8601 representation to convert, as for :meth:`isoparse`
+        :param default:
+            Value to return if the text cannot be converted
+
+        Text that does not have the syntax of a supported format is
+        rejected without an exception being raised, so this is cheaper
+        than handling exceptions from :meth:`isoparse` when many values
+        are malformed.
+
+        """
+        cache = cls._parse_cache
+        if cache is not None and cache.owner is cls:
+            value = cache.parse(cls._try_isoparse, text)
+        else:
+            value = cls._try_isoparse(text)
+        return default if value is None else value
+
+    @classmethod
+    def _try_isoparse(cls, text):
+        text, fields = _decode(text)
+        if fields is None:
+            return None
+        try:
+            return cls._from_decoded(text, fields)
+        except ValueError:
+            return None
+
+    @classmethod
+    def _isoparse(cls, text):
+        text, fields = _decode(text)
+        if fields is None:
             raise fd.partialdate.exceptions.ParseError(
-                'ISO 8601 time', text)
-        hour, minute, second = [
-            None if v in ('-', None) else int(v)
-            for v in m.group('hour', 'minute', 'second')
-        ]
-        tzinfo = _tzinfo(m.group('tzinfo'))
-        return cls(hour=hour, minute=minute, second=second, tzinfo=tzinfo)
+                'ISO 8601 time', fd.partialdate.utils.ascii_text(text))
+        return cls._from_decoded(text, fields)
+
+    @classmethod
+    def _from_decoded(cls, text, fields):
+        hour, minute, second, tzstr = fields
+        tzinfo = _tzinfo(tzstr)
+        _check(hour, minute, second)
+        self = cls._from_fields(hour, minute, second, tzinfo)
+        if text.__class__ is str:
+            self._source = text
+        return self
+
+    @classmethod
+    def isoparse_many(cls, values, errors: str = 'raise'):
+        """Parse a sequence of ISO 8601 time representations.
+
+        :param values:  Iterable of ISO 8601 representations to convert
+        :param errors:
+            How values that cannot be converted are handled:
+            ``'raise'`` propagates the exception, ``'skip'`` omits the
+            value, ``'none'`` substitutes ``None``, and ``'collect'``
+            substitutes ``None`` and records the failure.
+
+        A list of converted values is returned.  For ``'collect'``, a
+        second list is returned as well, containing pairs of the
+        position of each failing value and the exception describing
+        the failure.
+
+        """
+        return fd.partialdate.utils.parse_many(
+            cls.isoparse, cls.try_isoparse, values, errors)
+
+    @classmethod
+    def isoformat_many(cls, values, extended: bool = True) -> typing.List[str]:
+        """Return ISO 8601 representations of a sequence of times.
+
+        :param values:  Iterable of times to format
+        :param extended:
+            Prefer the extended format, if applicable for each value
+
+        """
+        return list(map(
+            functools.partial(cls.isoformat, extended=extended), values))
+
+    @classmethod
+    def write_iso(cls, values, fileobj, terminator: str = '\n',
+                  extended: bool = True) -> int:
+        """Write ISO 8601 representations of times to a file.
+
+        :param values:  Iterable of times to format
+        :param fileobj:
+            Text or binary file object to write to; binary file objects
+            receive ASCII-encoded text
+        :param terminator:  Text written after each value
+        :param extended:
+            Prefer the extended format, if applicable for each value
+
+        Values are written in batches rather than individually.  The
+        number of values written is returned.
+
+        """
+        return fd.partialdate.utils.write_formatted(
+            functools.partial(cls.isoformat, extended=extended),
+            values, fileobj, terminator)
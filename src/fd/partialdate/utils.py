@@ -5,35 +5,346 @@ These are not part of the public API.
 
 """
 
+import collections
+import errno
+import io
+import itertools
+import operator
 import re
+import threading
+import typing
+import weakref
+
+
+def ascii_bytes(text):
+    """Return a bytes-like value as :class:`bytes`.
+
+    Only the referenced portion of a :class:`memoryview` is copied.
+
+    """
+    if text.__class__ is bytes:
+        return text
+    try:
+        return bytes(memoryview(text))
+    except TypeError:
+        raise TypeError(
+            f'expected str or bytes-like object,'
+            f' not {text.__class__.__name__}') from None
+
+
+def ascii_text(text):
+    """Return text as :class:`str`, decoding ASCII bytes if needed.
+
+    Used only when reporting errors.
+
+    """
+    if isinstance(text, str):
+        return text
+    return text.decode('ascii', 'backslashreplace')
+
+
+# Zero-padded decimal representations, used when formatting.
+two_digits = tuple(f'{i:02}' for i in range(100))
+four_digits = tuple(f'{i:04}' for i in range(10000))
+
+# Values of pairs of ASCII digits, as text and as bytes, used when
+# parsing; anything else is absent.
+two_digit_values = {text: i for i, text in enumerate(two_digits)}
+two_digit_bytes_values = {
+    text.encode('ascii'): i for i, text in enumerate(two_digits)}
+
+
+if hasattr(str, 'isascii'):
+    isascii = str.isascii
+else:  # pragma: no cover
+    # Python 3.6
+    def isascii(text):
+        """Return true if text contains only ASCII characters."""
+        try:
+            text.encode('ascii')
+        except UnicodeEncodeError:
+            return False
+        return True
 
 
 class RegularExpressionGroup:
+    """Set of alternative regular expressions.
+
+    :param patterns:  Alternative patterns, in order of preference
+    :param names:  Names of the groups to report for a match
+    :param flags:  Flags used to compile each of the patterns
+    :param select:
+        Function that accepts the text to be matched and returns the
+        indexes of the patterns that could possibly match, in order of
+        preference.  If omitted, all patterns are tried.
 
-    def __init__(self, *patterns, flags=re.VERBOSE):
-        self.rxs = tuple(re.compile(pattern, flags) for pattern in patterns)
+    """
+
+    def __init__(self, *patterns, names, flags=re.VERBOSE, select=None):
+        rxs = []
+        for pattern in patterns:
+            rx = re.compile(pattern, flags)
+            # Group numbers are one-based; names not used in the pattern
+            # refer to a None appended to the groups of the match.
+            indexes = [rx.groupindex.get(name, rx.groups + 1) - 1
+                       for name in names]
+            padding = (None,) if rx.groups in indexes else ()
+            rxs.append((rx, operator.itemgetter(*indexes), padding))
+        self.rxs = tuple(rxs)
+        self.select = select
+        self.alternatives = tuple(range(len(self.rxs)))
 
     def match(self, text):
-        for rx in self.rxs:
+        """Match text against the alternative patterns.
+
+        Returns the index of the pattern that matched and a tuple of
+        the values of the named groups, or ``None`` if no pattern
+        matched.
+
+        """
+        if self.select is None:
+            alternatives = self.alternatives
+        else:
+            alternatives = self.select(text)
+        for alternative in alternatives:
+            rx, fields, padding = self.rxs[alternative]
             m = rx.match(text)
             if m is not None:
-                return RegularExpressionMatch(m)
+                return alternative, fields(m.groups() + padding)
         return None
 
 
-class RegularExpressionMatch:
+def parse_many(parse, try_parse, values, errors):
+    """Apply a parsing function to each of a sequence of values.
+
+    :param parse:  Parsing function, generally an ``isoparse`` method
+    :param try_parse:
+        Parsing function returning ``None`` instead of raising
+        :exc:`ValueError`, generally a ``try_isoparse`` method
+    :param values:  Iterable of values to parse
+    :param errors:  Policy for handling values that cannot be parsed
+
+    The error policy is one of ``'raise'`` (propagate the first
+    exception), ``'skip'`` (omit the value from the result),
+    ``'none'`` (use ``None`` in place of the value), or ``'collect'``
+    (as for ``'none'``, but also return a list of index, exception
+    pairs).  Except for ``'raise'``, values that are not text or
+    bytes-like, such as ``None``, are handled the same way as text that
+    cannot be parsed; the :exc:`TypeError` is collected for those.
+
+    Exceptions are only constructed for ``'raise'`` and ``'collect'``;
+    the other policies use `try_parse`, since raising and catching an
+    exception for each bad value costs more than parsing it.
+
+    """
+    if errors == 'raise':
+        return list(map(parse, values))
+    if errors not in ('skip', 'none', 'collect'):
+        raise ValueError(f'unknown error policy: {errors!r}')
+    results = []
+    append = results.append
+    if errors == 'skip':
+        for text in values:
+            try:
+                value = try_parse(text)
+            except TypeError:
+                continue
+            if value is not None:
+                append(value)
+        return results
+    if errors == 'none':
+        for text in values:
+            try:
+                append(try_parse(text))
+            except TypeError:
+                append(None)
+        return results
+    failures = []
+    for index, text in enumerate(values):
+        try:
+            append(parse(text))
+        except (ValueError, TypeError) as e:
+            append(None)
+            failures.append((index, e))
+    return results, failures
+
+
+# Number of values formatted for each write by write_formatted().
+write_batch_size = 1000
+
+
+def write_formatted(format, values, fileobj, terminator):
+    """Write formatted values to a text or binary file object.
+
+    :param format:  Formatting function accepting a single value
+    :param values:  Iterable of values to format
+    :param fileobj:  File object to write to
+    :param terminator:  Text written after each formatted value
+
+    Values are formatted and written in batches, so neither a string
+    for each value nor a string for the entire sequence is written.
+    Binary file objects (instances of :class:`io.RawIOBase` or
+    :class:`io.BufferedIOBase`) receive ASCII-encoded text.  The number
+    of values written is returned.
+
+    :exc:`BlockingIOError` is raised if a non-blocking binary file
+    object cannot accept more data; its ``characters_written``
+    attribute gives the number of bytes of the current batch that were
+    written.
+
+    """
+    binary = isinstance(fileobj, (io.RawIOBase, io.BufferedIOBase))
+    values = iter(values)
+    count = 0
+    while True:
+        batch = list(map(format, itertools.islice(values, write_batch_size)))
+        if not batch:
+            return count
+        count += len(batch)
+        batch.append('')
+        data = terminator.join(batch)
+        if not binary:
+            fileobj.write(data)
+            continue
+        data = memoryview(data.encode('ascii'))
+        size = len(data)
+        while data:
+            # Raw file objects may not accept all the data at once, and
+            # return None if a non-blocking write would block.
+            n = fileobj.write(data)
+            if n is None:
+                raise BlockingIOError(
+                    errno.EAGAIN, 'write could not complete without blocking',
+                    size - len(data))
+            data = data[n:]
+
 
-    def __init__(self, m):
-        self.m = m
+CacheInfo = collections.namedtuple(
+    'CacheInfo', ('hits', 'misses', 'evictions', 'maxsize', 'currsize'))
 
-    def group(self, *groups):
-        results = []
-        for gname in groups:
-            if gname in self.m.re.groupindex:
-                results.append(self.m.group(gname))
-            else:
-                results.append(None)
-        if len(groups) == 1:
-            return results[0]
+
+class ParseCache:
+    """Bounded, thread-safe LRU cache of parsed values.
+
+    Keys are the text passed to ``isoparse``; bytes-like keys are
+    converted to :class:`bytes` so they can be hashed.
+
+    """
+
+    def __init__(self, owner, maxsize):
+        self.owner = owner
+        self.maxsize = maxsize
+        self.hits = self.misses = self.evictions = 0
+        self._data = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def parse(self, parse, text):
+        """Return the cached value for text, or parse it and cache it.
+
+        :param parse:
+            Function converting the text; it may return ``None`` to
+            indicate a failure without raising an exception, in which
+            case nothing is cached
+
+        """
+        if not isinstance(text, str):
+            text = ascii_bytes(text)
+        with self._lock:
+            value = self._data.get(text)
+            if value is not None:
+                self._data.move_to_end(text)
+                self.hits += 1
+                return value
+            self.misses += 1
+        # Don't hold the lock while parsing; if another thread parses
+        # the same text concurrently, the last value stored wins.
+        value = parse(text)
+        if value is None:
+            return None
+        with self._lock:
+            self._data[text] = value
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def info(self):
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.evictions,
+                             self.maxsize, len(self._data))
+
+
+class ParseCaching:
+    """Class methods managing an optional cache for ``isoparse``.
+
+    Each class has its own cache; subclasses do not share the cache of
+    a base class.
+
+    """
+
+    __slots__ = ()
+
+    _parse_cache = None
+
+    @classmethod
+    def set_parse_cache(cls, maxsize: typing.Optional[int]):
+        """Enable or disable caching of parsed values for the class.
+
+        :param maxsize:
+            Maximum number of values retained, or ``None`` or ``0`` to
+            disable caching.
+
+        Values are returned from the cache when :meth:`isoparse` is
+        called with text that has already been parsed, so the same
+        instance may be returned for multiple calls.  Any existing
+        cache for the class is discarded.
+
+        """
+        if maxsize:
+            if maxsize < 0:
+                raise ValueError(
+                    f'cache size must not be negative: {maxsize}')
+            cls._parse_cache = ParseCache(cls, maxsize)
         else:
-            return tuple(results)
+            cls._parse_cache = None
+
+    @classmethod
+    def parse_cache_info(cls) -> typing.Optional[CacheInfo]:
+        """Return statistics for the parse cache, or ``None``.
+
+        The result is a named tuple with fields ``hits``, ``misses``,
+        ``evictions``, ``maxsize``, and ``currsize``.  ``None`` is
+        returned if caching is not enabled for the class.
+
+        """
+        cache = cls._parse_cache
+        if cache is not None and cache.owner is cls:
+            return cache.info()
+        return None
+
+    @classmethod
+    def parse_cache_clear(cls):
+        """Remove all values from the parse cache and reset statistics."""
+        cache = cls._parse_cache
+        if cache is not None and cache.owner is cls:
+            cache.clear()
+
+
+# Interned values, keyed by class and fields.  Values are only retained
+# while referenced elsewhere.
+_interned = weakref.WeakValueDictionary()
+
+
+def intern(key, value):
+    """Return the interned value for key, registering value if needed."""
+    return _interned.setdefault(key, value)
+
+
+def interned(key):
+    """Return the interned value for key, or ``None``."""
+    return _interned.get(key)
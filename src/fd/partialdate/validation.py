@@ -0,0 +1,131 @@
+"""\
+Validation of ISO 8601 representations without creating values.
+
+The rules are those applied by the ``isoparse`` methods, but only the
+kind of representation is reported; no value or exception is created.
+
+"""
+
+import typing
+
+import fd.partialdate.date
+import fd.partialdate.datetime
+import fd.partialdate.precision
+import fd.partialdate.time
+
+
+Precision = fd.partialdate.precision.Precision
+
+
+class Validation(typing.NamedTuple):
+    """Kind of a valid ISO 8601 representation."""
+
+    #: Precision of the date, or ``None`` if the kind has no date.
+    date: typing.Optional[Precision]
+
+    #: Precision of the time, or ``None`` if the kind has no time.
+    time: typing.Optional[Precision]
+
+    #: True if the extended format was used.  The extended format
+    #: exists only for complete dates and for times with at least the
+    #: hour and minute; other values always use the basic format.
+    extended: bool
+
+
+_date_precisions = fd.partialdate.precision.date_precisions
+_time_precisions = fd.partialdate.precision.time_precisions
+
+# Results are shared, so validation does not allocate them; they are
+# keyed by the bit masks of the date and time fields present, with 0
+# for a kind without a date or time.
+_validations = {
+    (dmask, tmask, extended): Validation(
+        _date_precisions[dmask], _time_precisions[tmask], extended)
+    for dmask in range(8)
+    for tmask in range(8)
+    for extended in (False, True)
+}
+
+_date_mask = fd.partialdate.date._mask
+_time_mask = fd.partialdate.time._mask
+
+
+def validate(text, kind=fd.partialdate.datetime.Datetime
+             ) -> typing.Optional[Validation]:
+    """Determine what an ISO 8601 representation describes.
+
+    :param text:  ISO 8601 representation as :class:`str` or bytes-like
+    :param kind:
+        Class the text is validated for;
+        :class:`~fd.partialdate.date.Date`,
+        :class:`~fd.partialdate.time.Time`, or
+        :class:`~fd.partialdate.datetime.Datetime`.
+
+    A :class:`Validation` is returned if the ``isoparse`` method of
+    `kind` would accept `text`, and ``None`` otherwise.
+
+    """
+    if issubclass(kind, fd.partialdate.datetime.Datetime):
+        return _validate_datetime(text)
+    if issubclass(kind, fd.partialdate.date.Date):
+        return _validate_date(text)
+    if issubclass(kind, fd.partialdate.time.Time):
+        return _validate_time(text)
+    raise TypeError(f'cannot validate text for {kind!r}')
+
+
+def _validate_date(text):
+    text, fields = fd.partialdate.date._decode(text)
+    if fields is None:
+        return None
+    year, month, day, ordinal = fields
+    if ordinal is not None:
+        if year is None:
+            return None
+        if not fd.partialdate.date._valid_ordinal(year, ordinal):
+            return None
+        extended = text[4:5] in ('-', b'-')
+        return _validations[0b111, 0, extended]
+    if not fd.partialdate.date._valid(year, month, day):
+        return None
+    dmask = _date_mask(year, month, day)
+    extended = dmask == 0b111 and text[4:5] in ('-', b'-')
+    return _validations[dmask, 0, extended]
+
+
+def _validate_time(text):
+    text, fields = fd.partialdate.time._decode(text)
+    if fields is None:
+        return None
+    hour, minute, second, tzstr = fields
+    if not fd.partialdate.time._valid_tz(tzstr):
+        return None
+    if not fd.partialdate.time._valid(hour, minute, second):
+        return None
+    tmask = _time_mask(hour, minute, second)
+    extended = (':' if text.__class__ is str else b':') in text
+    return _validations[0, tmask, extended]
+
+
+def _validate_datetime(text):
+    text, fields = fd.partialdate.datetime._decode(text)
+    if fields is None:
+        return None
+    year, month, day, ordinal, hour, minute, second, tzstr = fields
+    if ordinal is not None:
+        if year is None:
+            return None
+        if not fd.partialdate.date._valid_ordinal(year, ordinal):
+            return None
+        dmask = 0b111
+    elif fd.partialdate.date._valid(year, month, day):
+        dmask = _date_mask(year, month, day)
+    else:
+        return None
+    if not fd.partialdate.time._valid_tz(tzstr):
+        return None
+    if not fd.partialdate.time._valid(hour, minute, second):
+        return None
+    tmask = _time_mask(hour, minute, second)
+    extended = (':' if text.__class__ is str else b':') in text
+    return _validations[dmask, tmask, extended]
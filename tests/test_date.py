@@ -4,18 +4,30 @@ Tests for fd.partialdate.date.
 """
 
 import datetime
+import operator
 import unittest
 
 import fd.partialdate.date
+import fd.partialdate.precision
 import tests.utils
 
 
 class DateTestCase(
         tests.utils.AssertionHelpers,
+        tests.utils.BatchFormattingChecks,
+        tests.utils.BatchParsingChecks,
+        tests.utils.ParseCacheChecks,
+        tests.utils.TryParsingChecks,
+        tests.utils.InterningChecks,
+        tests.utils.PicklingChecks,
         tests.utils.DateRangeChecks,
         unittest.TestCase):
 
     factory = fd.partialdate.date.Date
+    module = fd.partialdate.date
+    valid = ['2021', '2021-12', '2021-12-08', '--08']
+    invalid = ['junk', '2021-999']
+    complete = '2021-12-08'
 
     def test_ymd_construction(self):
         date = self.factory(0, 12, 6)
@@ -230,6 +242,110 @@ class DateTestCase(
                 message,
                 'ordering not supported between incompatible partial dates')
 
+    def test_comparison_all_operators_incompatible(self):
+        ymd = self.factory(2021, 11, 8)
+        md = self.factory(month=11, day=8)
+        for op in (operator.lt, operator.le, operator.gt, operator.ge):
+            with self.assertRaises(ValueError):
+                op(ymd, md)
+            with self.assertRaises(ValueError):
+                op(md, ymd)
+        self.assertFalse(ymd == md)
+        self.assertTrue(ymd != md)
+
+    def test_sorting_partial(self):
+        values = [
+            self.factory(2021, 11, 8),
+            self.factory(2021),
+            self.factory(2020, 12),
+            self.factory(2021, 11),
+        ]
+        self.assertEqual(
+            sorted(values),
+            [values[2], values[1], values[3], values[0]])
+
+    def test_isoformat_memo(self):
+        date = self.factory(2021, 11, 8)
+        self.assertIs(date.isoformat(), date.isoformat())
+        self.assertIs(date.isoformat(extended=False),
+                      date.isoformat(extended=False))
+        for text in ('2021-11-08', '20211108', '2021-11', '2021', '-1108',
+                     '--08'):
+            date = self.factory.isoparse(text)
+            self.assertIn(text, (date.isoformat(),
+                                 date.isoformat(extended=False)))
+            self.assertIs(date.isoformat(extended='-' in text[1:]), text)
+        for text, expected in [('2021-312', '2021-11-08'),
+                               ('202111', '2021-11'),
+                               ('2021-11-08\n', '2021-11-08'),
+                               ('\u0662021-11-08', '2021-11-08')]:
+            date = self.factory.isoparse(text)
+            self.assertEqual(date.isoformat(), expected)
+
+    def test_intern(self):
+        value = self.factory.intern(2021, 11, 8)
+        self.assertIs(self.factory.intern(2021, 11, 8), value)
+        self.assertIs(self.factory.isoparse('2021-11-08', intern=True), value)
+        self.assertIsNot(self.factory.intern(2021, 11), value)
+        self.assertIsNot(self.factory.intern(month=11, day=8), value)
+        with self.assertRaises(ValueError):
+            self.factory.intern(2021, 2, 29)
+
+    def test_hash(self):
+        values = [
+            self.factory(2021, 11, 8),
+            self.factory(2021, 11),
+            self.factory(month=11, day=8),
+            self.factory(0, 1, 1),
+        ]
+        for value in values:
+            self.assertEqual(hash(value), hash(self.factory(
+                value.year, value.month, value.day)))
+        self.assertEqual(len(set(values + values)), len(values))
+        self.assertEqual(hash(values[0]), hash(datetime.date(2021, 11, 8)))
+        self.assertIn(datetime.date(2021, 11, 8), set(values))
+
+    def test_hash_leap_day_unknown_to_datetime(self):
+        # Accepted here, but not by datetime.date.
+        value = self.factory(1900, 2, 29)
+        self.assertEqual(hash(value), hash(self.factory(1900, 2, 29)))
+        self.assertIn(self.factory.isoparse('2100-02-29'),
+                      {self.factory(2100, 2, 29)})
+        self.assertNotEqual(value, self.factory(1900, 3, 1))
+
+    def test_sort_key(self):
+        values = [
+            self.factory(2021, 11, 8),
+            self.factory(day=3),
+            self.factory(2021),
+            self.factory(month=1, day=31),
+            self.factory(2020, 12),
+            self.factory(month=1, day=1),
+            self.factory(2021, 11),
+        ]
+        self.assertEqual(
+            sorted(values, key=self.factory.sort_key),
+            [values[4], values[2], values[6], values[0],
+             values[5], values[3], values[1]])
+        date = self.factory(2021, 11, 8)
+        self.assertEqual(date.sort_key(), self.factory(2021, 11, 8).sort_key())
+        self.assertIsInstance(date.sort_key(), int)
+
+    def test_precision(self):
+        Precision = fd.partialdate.precision.Precision
+        for fields, precision in [
+                ((2021, 11, 8), Precision.DATE),
+                ((2021, 11), Precision.YEAR_MONTH),
+                ((2021,), Precision.YEAR),
+                ((None, 11, 8), Precision.MONTH_DAY),
+                ((None, None, 8), Precision.DAY)]:
+            with self.subTest(fields=fields):
+                date = self.factory(*fields)
+                self.assertIs(date.precision, precision)
+                self.assertIs(
+                    self.factory.isoparse(date.isoformat()).precision,
+                    precision)
+
     def test_comparison_fully_specified(self):
         alt_factory = self.factory
         for ymd in [(2, 2, 2), (2021, 11, 8), (9998, 11, 29)]:
@@ -414,6 +530,36 @@ class DateTestCase(
                 self.assertEqual(cm.exception.max, 365)
                 self.assertEqual(cm.exception.value, oday)
 
+    def test_year_ordinal_round_trip(self):
+        for year in (0, 1, 2000, 2001, 9999):
+            length = 366 if year % 4 == 0 else 365
+            for ordinal in range(1, length + 1):
+                date = self.factory.from_year_ordinal(year, ordinal)
+                self.assertEqual(date.year, year)
+                self.assertEqual(date.toordinal_in_year(), ordinal)
+                self.assertEqual(
+                    self.factory.isoparse(f'{year:04}-{ordinal:03}'), date)
+        self.assertEqual(self.factory.from_year_ordinal(2000, 60),
+                         self.factory(2000, 2, 29))
+        self.assertEqual(self.factory.from_year_ordinal(2001, 60),
+                         self.factory(2001, 3, 1))
+
+    def test_from_year_ordinal_range_checks(self):
+        for year, ordinal, field, maximum in [(2000, 0, 'ordinal day', 366),
+                                              (2000, 367, 'ordinal day', 366),
+                                              (2001, 366, 'ordinal day', 365),
+                                              (10000, 1, 'year', 9999)]:
+            with self.assert_range_error() as cm:
+                self.factory.from_year_ordinal(year, ordinal)
+            self.assertEqual(cm.exception.field, field)
+            self.assertEqual(cm.exception.max, maximum)
+
+    def test_toordinal_in_year_partial(self):
+        with self.assertRaises(ValueError):
+            self.factory(2021, 11).toordinal_in_year()
+        with self.assertRaises(ValueError):
+            self.factory(month=11, day=8).toordinal_in_year()
+
     def test_y_isoparse(self):
         date = self.factory.isoparse('0000')
         self.assertEqual(date.year, 0)
@@ -449,6 +595,19 @@ class DateTestCase(
         self.assertEqual(date.isoformat(), '--08')
         self.assertEqual(str(date), '--08')
 
+    def test_isoparse_bytes(self):
+        for value in (b'2021-12-08', bytearray(b'20211208'),
+                      memoryview(b'[2021-342]')[1:-1]):
+            date = self.factory.isoparse(value)
+            self.assertEqual(date, self.factory(2021, 12, 8))
+
+        with self.assert_parse_error() as cm:
+            self.factory.isoparse(b'2021-12-\xd9\xa8')
+        self.assertEqual(cm.exception.value, '2021-12-\\xd9\\xa8')
+
+        with self.assertRaises(TypeError):
+            self.factory.isoparse(20211208)
+
     def test_isoparse_failures(self):
 
         def check(value):
@@ -475,3 +634,22 @@ class DateTestCase(
         # All components are omitted.
         check('-----')
         check('---')
+
+
+class DateReferenceEngineTestCase(tests.utils.ReferenceEngine, DateTestCase):
+    pass
+
+
+class DateParserEngineTestCase(
+        tests.utils.ParserEngineChecks,
+        unittest.TestCase):
+
+    factory = fd.partialdate.date.Date
+    module = fd.partialdate.date
+    what = 'ISO 8601 date'
+    pieces = (
+        '-', '--', '0000', '2021', '\u0662\u0660\u0662\u0661',
+        '0', '00', '02', '12', '13', '29', '31', '32',
+        '000', '001', '060', '365', '366', '999',
+        'x', ' ', '\n',
+    )
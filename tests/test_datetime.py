@@ -4,15 +4,32 @@ Tests for fd.partialdate.datetime.
 """
 
 import datetime
+import io
+import sys
 import unittest
 
+import fd.partialdate.date
 import fd.partialdate.datetime
+import fd.partialdate.precision
+import fd.partialdate.time
 import tests.utils
 
 
-class DatetimeTestCase(tests.utils.AssertionHelpers, unittest.TestCase):
+class DatetimeTestCase(
+        tests.utils.AssertionHelpers,
+        tests.utils.BatchFormattingChecks,
+        tests.utils.BatchParsingChecks,
+        tests.utils.ParseCacheChecks,
+        tests.utils.TryParsingChecks,
+        tests.utils.InterningChecks,
+        tests.utils.PicklingChecks,
+        unittest.TestCase):
 
     factory = fd.partialdate.datetime.Datetime
+    module = fd.partialdate.datetime
+    valid = ['2021T12', '2021-12-08T12:30', '--08T1230Z']
+    invalid = ['junk', '2021-13-01T12:00']
+    complete = '2021-12-08T12:30:45+05:30'
 
     def test_ymdhms_construction(self):
         dt = fd.partialdate.datetime.Datetime(0, 12, 6, 12, 11, 42)
@@ -103,6 +120,61 @@ class DatetimeTestCase(tests.utils.AssertionHelpers, unittest.TestCase):
         self.assertEqual(dt.isoformat(extended=False), '-1229T1211')
         self.assertEqual(str(dt), '-1229 1211')
 
+    def test_construction_range_checks(self):
+        with self.assertRaises(ValueError):
+            fd.partialdate.datetime.Datetime(2021, 2, 30, 12)
+        with self.assertRaises(ValueError):
+            fd.partialdate.datetime.Datetime(2021, 2, 28, 24)
+        with self.assertRaises(ValueError):
+            fd.partialdate.datetime.Datetime(2021, None, 28, 12)
+
+    def test_combine_partial(self):
+        date = fd.partialdate.date.Date(None, 12, 6)
+        time = fd.partialdate.time.Time(12, 11, tzinfo=datetime.timezone.utc)
+        dt = fd.partialdate.datetime.Datetime.combine(date, time)
+        self.assertEqual(
+            dt, fd.partialdate.datetime.Datetime(
+                None, 12, 6, 12, 11, tzinfo=datetime.timezone.utc))
+        self.assertTrue(dt.partial)
+        self.assertEqual(dt.date(), date)
+        self.assertEqual(dt.timetz(), time)
+
+    def test_date_time_views(self):
+        tz = datetime.timezone(datetime.timedelta(hours=-5))
+        dt = fd.partialdate.datetime.Datetime(
+            2021, 12, 6, 12, 11, tzinfo=tz)
+        date = dt.date()
+        self.assertIsInstance(date, fd.partialdate.date.Date)
+        self.assertEqual(date, fd.partialdate.date.Date(2021, 12, 6))
+        time = dt.time()
+        self.assertIsInstance(time, fd.partialdate.time.Time)
+        self.assertEqual(time, fd.partialdate.time.Time(12, 11))
+        self.assertIsNone(time.tzinfo)
+        self.assertEqual(dt.timetz(),
+                         fd.partialdate.time.Time(12, 11, tzinfo=tz))
+
+    def test_combine_stdlib(self):
+        tz = datetime.timezone(datetime.timedelta(hours=-5))
+        dt = fd.partialdate.datetime.Datetime.combine(
+            datetime.date(2021, 12, 6), datetime.time(12, 11, 42, tzinfo=tz))
+        self.assertEqual(
+            dt, fd.partialdate.datetime.Datetime(
+                2021, 12, 6, 12, 11, 42, tzinfo=tz))
+        self.assertFalse(dt.partial)
+
+    def test_combine_errors(self):
+        combine = fd.partialdate.datetime.Datetime.combine
+        date = fd.partialdate.date.Date(2021, 12, 6)
+        time = fd.partialdate.time.Time(12, 11)
+        with self.assertRaises(TypeError):
+            combine(datetime.datetime(2021, 12, 6), time)
+        with self.assertRaises(TypeError):
+            combine('2021-12-06', time)
+        with self.assertRaises(TypeError):
+            combine(date, '12:11')
+        with self.assertRaises(ValueError):
+            combine(date, datetime.time(12, 11, 42, 500))
+
     def test_rando_comparison_fully_specified(self):
         for ymdhms in [(2, 2, 2, 2, 2, 2),
                        (2021, 11, 8, 12, 11, 42),
@@ -223,6 +295,19 @@ class DatetimeTestCase(tests.utils.AssertionHelpers, unittest.TestCase):
             self.assertLess(pdate, alt_factory(year, month, day,
                                                hour, minute, second+1))
 
+    def test_comparison_incompatible_times(self):
+        factory = fd.partialdate.datetime.Datetime
+        hms = factory(2021, 11, 8, 12, 30, 0)
+        ms = factory(2021, 11, 8, minute=30, second=0)
+        with self.assertRaises(ValueError) as cm:
+            hms <= ms
+        self.assertEqual(
+            str(cm.exception),
+            'ordering not supported between incompatible partial times')
+        # Times are only considered when the dates are equal.
+        self.assertLess(ms, factory(2021, 11, 9, 12, 30, 0))
+        self.assertGreater(factory(2021, 11, 9, minute=30, second=0), hms)
+
     def test_comparison_fully_specified(self):
         factory = fd.partialdate.datetime.Datetime
         for ymdhms in [(2, 2, 2, 2, 2, 2),
@@ -320,6 +405,102 @@ class DatetimeTestCase(tests.utils.AssertionHelpers, unittest.TestCase):
         self.assertNotEqual(rhs, lhs)
         self.assertNotEqual(lhs, rhs)
 
+    def test_comparison_complete_mixed_timezones_stdlib_order(self):
+        factory = fd.partialdate.datetime.Datetime
+        timezones = [
+            datetime.timezone(datetime.timedelta(hours=-12)),
+            datetime.timezone.utc,
+            datetime.timezone(datetime.timedelta(hours=13, minutes=45)),
+        ]
+        if sys.version_info >= (3, 7):
+            # Earlier versions require offsets in whole minutes.
+            timezones.append(
+                datetime.timezone(datetime.timedelta(seconds=30)))
+        values = [
+            factory(*ymd, hour, 30, 15, tzinfo=tzinfo)
+            for ymd in [(1900, 2, 28), (1900, 3, 1), (2000, 2, 29),
+                        (2000, 3, 1), (2021, 12, 31), (2022, 1, 1)]
+            for hour in (0, 23)
+            for tzinfo in timezones
+        ]
+        stdlib = [
+            datetime.datetime(
+                value.year, value.month, value.day,
+                value.hour, value.minute, value.second,
+                tzinfo=value.tzinfo)
+            for value in values
+        ]
+        for lhs, slhs in zip(values, stdlib):
+            for rhs, srhs in zip(values, stdlib):
+                self.assertEqual(lhs == rhs, slhs == srhs)
+                self.assertEqual(lhs < rhs, slhs < srhs)
+                self.assertEqual(lhs >= rhs, slhs >= srhs)
+                srhs = srhs.replace(microsecond=1)
+                self.assertEqual(lhs == srhs, slhs == srhs)
+                self.assertEqual(lhs < srhs, slhs < srhs)
+
+    def test_comparison_mixed_timezones_outside_stdlib_range(self):
+        # Dates datetime cannot represent cannot be compared across time
+        # zones.
+        factory = fd.partialdate.datetime.Datetime
+        timezone1 = datetime.timezone(datetime.timedelta(hours=1))
+        for ymd in [(0, 1, 1), (2100, 2, 29)]:
+            lhs = factory(*ymd, 12, 0, 0, tzinfo=datetime.timezone.utc)
+            rhs = factory(*ymd, 12, 0, 0, tzinfo=timezone1)
+            with self.assertRaises(ValueError):
+                lhs == rhs
+            with self.assertRaises(ValueError):
+                lhs < rhs
+
+    def test_timestamp_key(self):
+        factory = fd.partialdate.datetime.Datetime
+        epoch = datetime.datetime(1, 1, 1, tzinfo=datetime.timezone.utc)
+        timezone1 = datetime.timezone(datetime.timedelta(hours=1))
+        for value in [
+                factory(1, 1, 1, 0, 0, 0, tzinfo=datetime.timezone.utc),
+                factory(1, 1, 1, 0, 0, 0, tzinfo=timezone1),
+                factory(2021, 12, 29, 1, 15, 42, tzinfo=timezone1),
+                factory.isoparse('1900-03-01T00:00:00-05:30'),
+                factory.isoparse('9999-12-31T23:59:59Z')]:
+            with self.subTest(value=value):
+                expected = datetime.datetime(
+                    value.year, value.month, value.day,
+                    value.hour, value.minute, value.second,
+                    tzinfo=value.tzinfo) - epoch
+                self.assertEqual(
+                    value.timestamp_key(), expected.days * 86400
+                    + expected.seconds)
+        self.assertEqual(
+            factory(2021, 12, 29, 1, 15, 42,
+                    tzinfo=datetime.timezone.utc).timestamp_key(),
+            factory(2021, 12, 29, 2, 15, 42,
+                    tzinfo=timezone1).timestamp_key())
+
+    def test_timestamp_key_other_tzinfo(self):
+
+        class Plus2(datetime.tzinfo):
+
+            def utcoffset(self, dt):
+                return datetime.timedelta(hours=2)
+
+        factory = fd.partialdate.datetime.Datetime
+        self.assertEqual(
+            factory(2021, 12, 29, 3, 15, 42, tzinfo=Plus2()).timestamp_key(),
+            factory(2021, 12, 29, 1, 15, 42,
+                    tzinfo=datetime.timezone.utc).timestamp_key())
+
+    def test_timestamp_key_unsupported(self):
+        factory = fd.partialdate.datetime.Datetime
+        utc = datetime.timezone.utc
+        with self.assertRaises(ValueError):
+            factory(2021, 12, 29, 1, 15, tzinfo=utc).timestamp_key()
+        with self.assertRaises(ValueError):
+            factory(2021, 12, 29, 1, 15, 42).timestamp_key()
+        with self.assertRaises(ValueError):
+            factory(0, 12, 29, 1, 15, 42, tzinfo=utc).timestamp_key()
+        with self.assertRaises(ValueError):
+            factory(2100, 2, 29, 1, 15, 42, tzinfo=utc).timestamp_key()
+
     def test_comparison_partial_mixed_timezones(self):
         timezone0 = datetime.timezone.utc
         timezone1 = datetime.timezone(datetime.timedelta(hours=1))
@@ -374,6 +555,94 @@ class DatetimeTestCase(tests.utils.AssertionHelpers, unittest.TestCase):
                       message)
         self.assertIn('different time zones', message)
 
+    def test_isoformat_many_sep(self):
+        factory = fd.partialdate.datetime.Datetime
+        values = [factory(2021, 11, 8, 12, 30), factory(2021, hour=12)]
+        self.assertEqual(factory.isoformat_many(values, sep=' '),
+                         ['2021-11-08 12:30', '2021 12'])
+        f = io.StringIO()
+        factory.write_iso(values, f, terminator=',', extended=False, sep=' ')
+        self.assertEqual(f.getvalue(), '20211108 1230,2021 12,')
+
+    def test_isoformat_memo(self):
+        factory = fd.partialdate.datetime.Datetime
+        dt = factory(2021, 11, 8, 12, 30, 15)
+        self.assertIs(dt.isoformat(), dt.isoformat())
+        self.assertEqual(dt.isoformat(sep=' '), '2021-11-08 12:30:15')
+        for text in ('2021-11-08T12:30:15', '2021-11-08T12:30Z',
+                     '20211108T1230+0530', '20211108T12', '2021T12',
+                     '-1108T--15Z'):
+            dt = factory.isoparse(text)
+            self.assertIs(dt.isoformat(extended=':' in text), text)
+        for text, expected in [('2021-11-08t12:30:15', '2021-11-08T12:30:15'),
+                               ('2021-11-08 12:30', '2021-11-08T12:30'),
+                               ('2021-312T12:30', '2021-11-08T12:30'),
+                               ('202111T12', '2021-11T12'),
+                               ('20211108T12z', '20211108T12Z'),
+                               ('20211108T12+05', '20211108T12+0500')]:
+            dt = factory.isoparse(text)
+            self.assertEqual(dt.isoformat(extended=':' in text), expected)
+
+    def test_intern(self):
+        factory = fd.partialdate.datetime.Datetime
+        value = factory.intern(2021, 11, 8, 12, 30)
+        self.assertIs(factory.intern(2021, 11, 8, 12, 30), value)
+        self.assertIs(factory.isoparse('2021-11-08T12:30', intern=True), value)
+        self.assertIsNot(factory.intern(2021, 11, 8, 12), value)
+        with self.assertRaises(ValueError):
+            factory.intern(2021, 11, 8, 24)
+
+    def test_hash(self):
+        factory = fd.partialdate.datetime.Datetime
+        utc = datetime.timezone.utc
+        minus5 = datetime.timezone(datetime.timedelta(hours=-5))
+        values = [
+            factory(2021, 11, 8, 12, 30, 15),
+            factory(2021, 11, 8, 12, 30),
+            factory(2021, 11, 8, 12, 30, tzinfo=utc),
+            factory(month=11, day=8, hour=12),
+            factory(0, 1, 1, 0, 0, 0, tzinfo=utc),
+        ]
+        self.assertEqual(len(set(values + values)), len(values))
+        self.assertEqual(
+            hash(factory(2021, 11, 8, 12, 30, tzinfo=utc)), hash(values[2]))
+        self.assertEqual(
+            hash(values[0]), hash(datetime.datetime(2021, 11, 8, 12, 30, 15)))
+        self.assertEqual(
+            hash(factory(2021, 11, 8, 17, 30, 15, tzinfo=utc)),
+            hash(factory(2021, 11, 8, 12, 30, 15, tzinfo=minus5)))
+        self.assertIn(datetime.datetime(2021, 11, 8, 12, 30, 15), set(values))
+
+    def test_sort_key(self):
+        factory = fd.partialdate.datetime.Datetime
+        values = [
+            factory(2021, 11, 8, 12, 30, 15),
+            factory(2021, 11, 8, minute=30, second=0),
+            factory(2021, 11, 8, 12),
+            factory(2021, 11, 7, 23, 59, 59),
+            factory(2021, 11, 9, 0),
+            factory(month=11, day=8, hour=12),
+        ]
+        self.assertEqual(
+            sorted(values, key=factory.sort_key),
+            [values[3], values[2], values[0], values[1],
+             values[4], values[5]])
+
+    def test_precision(self):
+        Precision = fd.partialdate.precision.Precision
+        factory = fd.partialdate.datetime.Datetime
+        dt = factory(2021, 11, 8, 12, 30, 15)
+        self.assertIs(dt.date_precision, Precision.DATE)
+        self.assertIs(dt.time_precision, Precision.TIME)
+        dt = factory(month=11, day=8, minute=30, second=15)
+        self.assertIs(dt.date_precision, Precision.MONTH_DAY)
+        self.assertIs(dt.time_precision, Precision.MINUTE_SECOND)
+        dt = factory.isoparse('2021T12')
+        self.assertIs(dt.date_precision, Precision.YEAR)
+        self.assertIs(dt.time_precision, Precision.HOUR)
+        self.assertIs(dt.date().precision, dt.date_precision)
+        self.assertIs(dt.time().precision, dt.time_precision)
+
     def test_repr_positional(self):
         dt = fd.partialdate.datetime.Datetime(
             year=2021, month=12, day=29, hour=12)
@@ -673,3 +942,26 @@ class TimeRangeCheckTestCase(
         return fd.partialdate.datetime.Datetime(
             2021, 12, 29, hour=hour, minute=minute, second=second,
             tzinfo=tzinfo)
+
+
+class DatetimeReferenceEngineTestCase(
+        tests.utils.ReferenceEngine,
+        DatetimeTestCase):
+    pass
+
+
+class DatetimeParserEngineTestCase(
+        tests.utils.ParserEngineChecks,
+        unittest.TestCase):
+
+    factory = fd.partialdate.datetime.Datetime
+    module = fd.partialdate.datetime
+    what = 'ISO 8601 datetime'
+    pieces = (
+        '-', '--', '2021-12-08', '2021-060', '0000-366', '2021-13-32',
+        '20211208', '2021060', '202112', '2021', '-1208', '--08', '2021-08',
+        'T', 't', ' ', 'T12:30', 'T12', 'T1230', 'T-30', 'T--', 'T24',
+        'T12:30:45', 'T123045',
+        '12:30:45', ':45', '1230', '45', '-30', 'Z', 'z', '+05', '-0530',
+        '+05:30', '+24', 'x', '\n',
+    )
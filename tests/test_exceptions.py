@@ -0,0 +1,46 @@
+"""\
+Tests for fd.partialdate.exceptions.
+
+"""
+
+import unittest
+
+import fd.partialdate.exceptions
+
+
+class ParseErrorTestCase(unittest.TestCase):
+
+    def test_message(self):
+        exc = fd.partialdate.exceptions.ParseError('ISO 8601 date', '2021-')
+        self.assertEqual(exc.what, 'ISO 8601 date')
+        self.assertEqual(exc.value, '2021-')
+        self.assertEqual(exc.args, ('ISO 8601 date', '2021-'))
+        self.assertEqual(
+            exc.message,
+            "text cannot be parsed as an ISO 8601 date: '2021-'")
+        self.assertEqual(str(exc), exc.message)
+        self.assertIs(exc.message, exc.message)
+
+    def test_message_assignment(self):
+        exc = fd.partialdate.exceptions.ParseError('ISO 8601 date', '2021-')
+        exc.message = 'not a date'
+        self.assertEqual(str(exc), 'not a date')
+
+
+class RangeErrorTestCase(unittest.TestCase):
+
+    def test_message(self):
+        exc = fd.partialdate.exceptions.RangeError('month', 13, 1, 12)
+        self.assertEqual(exc.field, 'month')
+        self.assertEqual(exc.value, 13)
+        self.assertEqual(exc.min, 1)
+        self.assertEqual(exc.max, 12)
+        self.assertEqual(exc.args, ('month', 13, 1, 12))
+        self.assertEqual(exc.message, 'month is out of range [1..12]: 13')
+        self.assertEqual(str(exc), exc.message)
+        self.assertIs(exc.message, exc.message)
+
+    def test_message_assignment(self):
+        exc = fd.partialdate.exceptions.RangeError('month', 13, 1, 12)
+        exc.message = 'bad month'
+        self.assertEqual(str(exc), 'bad month')
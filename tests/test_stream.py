@@ -0,0 +1,131 @@
+"""\
+Tests for fd.partialdate.stream.
+
+"""
+
+import io
+import unittest.mock
+
+import fd.partialdate.date
+import fd.partialdate.datetime
+import fd.partialdate.exceptions
+import fd.partialdate.stream
+import fd.partialdate.time
+import tests.utils
+
+
+class StreamTestCase(tests.utils.AssertionHelpers, unittest.TestCase):
+
+    def test_text_lines(self):
+        lines = io.StringIO('2021-12-08T12:30\n--08T12Z\r\n2021T12')
+        values = list(fd.partialdate.stream.iparse(lines))
+        self.assertEqual(values, [
+            fd.partialdate.datetime.Datetime(2021, 12, 8, 12, 30),
+            fd.partialdate.datetime.Datetime.isoparse('--08T12Z'),
+            fd.partialdate.datetime.Datetime(2021, hour=12),
+        ])
+
+    def test_bytes_lines(self):
+        lines = io.BytesIO(b'2021-12-08\r\n--08\n2021')
+        values = list(fd.partialdate.stream.iparse(
+            lines, kind=fd.partialdate.date.Date))
+        self.assertEqual(values, [
+            fd.partialdate.date.Date(2021, 12, 8),
+            fd.partialdate.date.Date(day=8),
+            fd.partialdate.date.Date(2021),
+        ])
+
+    def test_kind(self):
+        values = fd.partialdate.stream.iparse(
+            ['12:30\n', '--45\n'], kind=fd.partialdate.time.Time)
+        self.assertEqual(list(values), [
+            fd.partialdate.time.Time(12, 30),
+            fd.partialdate.time.Time(second=45),
+        ])
+
+    def test_lazy(self):
+
+        def lines():
+            yield '2021\n'
+            raise AssertionError('consumed too many lines')
+
+        values = fd.partialdate.stream.iparse(
+            lines(), kind=fd.partialdate.date.Date)
+        self.assertEqual(next(values), fd.partialdate.date.Date(2021))
+
+    def test_errors_raise(self):
+        values = fd.partialdate.stream.iparse(
+            ['2021\n', 'junk\n', '2022\n'], kind=fd.partialdate.date.Date)
+        self.assertEqual(next(values), fd.partialdate.date.Date(2021))
+        with self.assert_parse_error() as cm:
+            next(values)
+        # The line terminator is not part of the reported value.
+        self.assertEqual(cm.exception.value, 'junk')
+        self.assertEqual(cm.exception.what, 'ISO 8601 date')
+
+    def test_errors_raise_non_ascii(self):
+        values = fd.partialdate.stream.iparse(
+            [b'20\xe921\n'], kind=fd.partialdate.date.Date)
+        with self.assert_parse_error() as cm:
+            next(values)
+        self.assertEqual(cm.exception.value, '20\\xe921')
+
+    def test_errors_skip(self):
+        values = fd.partialdate.stream.iparse(
+            ['2021\n', 'junk\n', '2021-999\n', '2022\n'],
+            kind=fd.partialdate.date.Date, errors='skip')
+        self.assertEqual(list(values), [
+            fd.partialdate.date.Date(2021),
+            fd.partialdate.date.Date(2022),
+        ])
+
+    def test_errors_none(self):
+        values = fd.partialdate.stream.iparse(
+            ['2021\n', 'junk\n', '2021-999\n', '2022\n'],
+            kind=fd.partialdate.date.Date, errors='none')
+        self.assertEqual(list(values), [
+            fd.partialdate.date.Date(2021),
+            None,
+            None,
+            fd.partialdate.date.Date(2022),
+        ])
+
+    def test_errors_non_text(self):
+        lines = ['2021\n', None, 42, b'2022\n']
+        values = fd.partialdate.stream.iparse(
+            lines, kind=fd.partialdate.date.Date, errors='skip')
+        self.assertEqual(list(values), [
+            fd.partialdate.date.Date(2021),
+            fd.partialdate.date.Date(2022),
+        ])
+        values = fd.partialdate.stream.iparse(
+            lines, kind=fd.partialdate.date.Date, errors='none')
+        self.assertEqual(list(values), [
+            fd.partialdate.date.Date(2021),
+            None,
+            None,
+            fd.partialdate.date.Date(2022),
+        ])
+        values = fd.partialdate.stream.iparse(
+            lines, kind=fd.partialdate.date.Date)
+        next(values)
+        with self.assertRaises(TypeError):
+            next(values)
+
+    def test_errors_no_parse_error(self):
+        # Lenient policies reject syntax errors without creating an
+        # exception.
+        with unittest.mock.patch.object(
+                fd.partialdate.exceptions, 'ParseError',
+                side_effect=AssertionError('exception created')):
+            for errors, expected in [('skip', []), ('none', [None])]:
+                values = fd.partialdate.stream.iparse(
+                    ['junk\n'], kind=fd.partialdate.date.Date,
+                    errors=errors)
+                self.assertEqual(list(values), expected)
+
+    def test_errors_unknown(self):
+        with self.assertRaises(ValueError) as cm:
+            fd.partialdate.stream.iparse([], errors='collect')
+        self.assertEqual(str(cm.exception),
+                         "unknown error policy: 'collect'")
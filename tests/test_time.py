@@ -4,18 +4,30 @@ Tests for fd.partialdate.time.
 """
 
 import datetime
+import sys
 import unittest
 
+import fd.partialdate.precision
 import fd.partialdate.time
 import tests.utils
 
 
 class TimeTestCase(
         tests.utils.AssertionHelpers,
+        tests.utils.BatchFormattingChecks,
+        tests.utils.BatchParsingChecks,
+        tests.utils.ParseCacheChecks,
+        tests.utils.TryParsingChecks,
+        tests.utils.InterningChecks,
+        tests.utils.PicklingChecks,
         tests.utils.TimeRangeChecks,
         unittest.TestCase):
 
     factory = fd.partialdate.time.Time
+    module = fd.partialdate.time
+    valid = ['12', '12:30', '123045Z', '--45']
+    invalid = ['junk', '24']
+    complete = '12:30:45+05:30'
 
     def test_hms_construction(self):
         time = fd.partialdate.time.Time(21, 12, 6)
@@ -426,6 +438,40 @@ class TimeTestCase(
         self.assertNotEqual(rhs, lhs)
         self.assertNotEqual(lhs, rhs)
 
+    def test_comparison_complete_mixed_timezones_stdlib_order(self):
+        # Offsets are applied without wrapping around midnight, as for
+        # aware datetime.time values.
+        timezones = [
+            datetime.timezone(datetime.timedelta(hours=-5)),
+            datetime.timezone.utc,
+            datetime.timezone(datetime.timedelta(hours=13, minutes=45)),
+        ]
+        if sys.version_info >= (3, 7):
+            # Earlier versions require offsets in whole minutes.
+            timezones.append(
+                datetime.timezone(datetime.timedelta(seconds=30)))
+        values = [
+            self.factory(hour, 30, 15, tzinfo=tzinfo)
+            for hour in (0, 5, 23)
+            for tzinfo in timezones
+        ]
+        stdlib = [
+            datetime.time(value.hour, value.minute, value.second,
+                          tzinfo=value.tzinfo)
+            for value in values
+        ]
+        for lhs, slhs in zip(values, stdlib):
+            for rhs, srhs in zip(values, stdlib):
+                self.assertEqual(lhs == rhs, slhs == srhs)
+                self.assertEqual(lhs < rhs, slhs < srhs)
+                self.assertEqual(lhs >= rhs, slhs >= srhs)
+                srhs = srhs.replace(microsecond=1)
+                self.assertEqual(lhs == srhs, slhs == srhs)
+                self.assertEqual(lhs < srhs, slhs < srhs)
+        self.assertEqual(
+            [stdlib[values.index(value)] for value in sorted(values)],
+            sorted(stdlib))
+
     def test_comparison_partial_mixed_timezones(self):
         timezone0 = datetime.timezone.utc
         timezone1 = datetime.timezone(datetime.timedelta(hours=1))
@@ -473,6 +519,111 @@ class TimeTestCase(
                       message)
         self.assertIn('different time zones', message)
 
+    def test_shared_timezones(self):
+        parsed = [
+            self.factory.isoparse(text).tzinfo
+            for text in ('12+05', '1200+0500', '12:00+05:00', b'12+05')
+        ]
+        for tzinfo in parsed:
+            self.assertIs(tzinfo, parsed[0])
+        self.assertEqual(
+            parsed[0], datetime.timezone(datetime.timedelta(hours=5)))
+        self.assertIs(self.factory.isoparse('12-00').tzinfo,
+                      datetime.timezone.utc)
+        for i in range(2):
+            with self.assertRaises(ValueError):
+                self.factory.isoparse('12+24')
+
+    def test_isoformat_timezones(self):
+        tz = datetime.timezone(datetime.timedelta(hours=-5, minutes=-30))
+        time = self.factory(12, 30, tzinfo=tz)
+        for i in range(2):
+            self.assertEqual(time.isoformat(), '12:30-05:30')
+            self.assertEqual(time.isoformat(extended=False), '1230-0530')
+
+        class Fixed(datetime.tzinfo):
+
+            def utcoffset(self, dt):
+                return datetime.timedelta(hours=2)
+
+        time = self.factory(12, 30, tzinfo=Fixed())
+        self.assertEqual(time.isoformat(), '12:30+02:00')
+
+    def test_isoformat_memo(self):
+        time = self.factory(12, 30, 15)
+        self.assertIs(time.isoformat(), time.isoformat())
+        for text in ('12:30:15', '12:30:15Z', '12:30+05:00', '1230-0530',
+                     '123015', '12', '12Z', '-3015', '--15+0100'):
+            time = self.factory.isoparse(text)
+            self.assertIs(time.isoformat(extended=':' in text), text)
+        for text, expected in [('12:30:15z', '12:30:15Z'),
+                               ('12:30:15+05', '12:30:15+05:00'),
+                               ('1230+00', '1230Z'),
+                               ('12:30-00:00', '12:30Z'),
+                               ('12:30:15\n', '12:30:15')]:
+            time = self.factory.isoparse(text)
+            self.assertEqual(
+                time.isoformat(extended=':' in text), expected)
+
+    def test_intern(self):
+        utc = datetime.timezone.utc
+        value = self.factory.intern(12, 30, tzinfo=utc)
+        self.assertIs(self.factory.intern(12, 30, tzinfo=utc), value)
+        self.assertIs(self.factory.isoparse('12:30Z', intern=True), value)
+        self.assertIsNot(self.factory.intern(12, 30), value)
+        with self.assertRaises(ValueError):
+            self.factory.intern(24)
+
+    def test_hash(self):
+        utc = datetime.timezone.utc
+        minus5 = datetime.timezone(datetime.timedelta(hours=-5))
+        values = [
+            self.factory(12, 30, 15),
+            self.factory(12, 30),
+            self.factory(12, 30, tzinfo=utc),
+            self.factory(minute=30, second=15),
+        ]
+        self.assertEqual(len(set(values + values)), len(values))
+        self.assertEqual(
+            hash(self.factory(12, 30, tzinfo=utc)), hash(values[2]))
+        self.assertEqual(hash(values[0]), hash(datetime.time(12, 30, 15)))
+        self.assertEqual(
+            hash(self.factory(17, 30, 15, tzinfo=utc)),
+            hash(self.factory(12, 30, 15, tzinfo=minus5)))
+        self.assertEqual(
+            hash(self.factory(17, 30, 15, tzinfo=utc)),
+            hash(datetime.time(12, 30, 15, tzinfo=minus5)))
+
+    def test_sort_key(self):
+        values = [
+            self.factory(12, 30, 15),
+            self.factory(second=3),
+            self.factory(12),
+            self.factory(minute=1, second=59),
+            self.factory(11, 59),
+            self.factory(minute=1, second=0),
+            self.factory(12, 30),
+        ]
+        self.assertEqual(
+            sorted(values, key=self.factory.sort_key),
+            [values[4], values[2], values[6], values[0],
+             values[5], values[3], values[1]])
+
+    def test_precision(self):
+        Precision = fd.partialdate.precision.Precision
+        for fields, precision in [
+                ((12, 30, 15), Precision.TIME),
+                ((12, 30), Precision.HOUR_MINUTE),
+                ((12,), Precision.HOUR),
+                ((None, 30, 15), Precision.MINUTE_SECOND),
+                ((None, None, 15), Precision.SECOND)]:
+            with self.subTest(fields=fields):
+                time = self.factory(*fields)
+                self.assertIs(time.precision, precision)
+                self.assertIs(
+                    self.factory.isoparse(time.isoformat()).precision,
+                    precision)
+
     def test_repr_positional(self):
         time = fd.partialdate.time.Time(12)
         self.assertEqual(repr(time), 'fd.partialdate.time.Time(12)')
@@ -674,3 +825,22 @@ class TimeTestCase(
 
         # All components are omitted.
         check('---')
+
+
+class TimeReferenceEngineTestCase(tests.utils.ReferenceEngine, TimeTestCase):
+    pass
+
+
+class TimeParserEngineTestCase(
+        tests.utils.ParserEngineChecks,
+        unittest.TestCase):
+
+    factory = fd.partialdate.time.Time
+    module = fd.partialdate.time
+    what = 'ISO 8601 time'
+    pieces = (
+        '-', '--', ':', '00', '12', '23', '24', '59', '60',
+        '1', '123', '\u0661\u0662', '12:30', '1230', ':45',
+        'Z', 'z', '+', '-05', '+05', '+0530', '-00:00', '+24', '+99:99',
+        'x', '\n',
+    )
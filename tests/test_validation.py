@@ -0,0 +1,136 @@
+"""\
+Tests for fd.partialdate.validation.
+
+"""
+
+import itertools
+import unittest
+
+import fd.partialdate
+import fd.partialdate.date
+import fd.partialdate.datetime
+import fd.partialdate.time
+import fd.partialdate.validation
+
+
+Precision = fd.partialdate.validation.Precision
+Validation = fd.partialdate.validation.Validation
+
+Date = fd.partialdate.date.Date
+Datetime = fd.partialdate.datetime.Datetime
+Time = fd.partialdate.time.Time
+
+dates = [
+    '', '-', '--', '2021', '0000', '2021-12', '2021-13', '2021-00',
+    '-12', '-1208', '-1232', '-0230', '-0229', '--08', '--32', '--00',
+    '20211208', '2021-12-08', '2021-12-32', '2021-02-29', '2020-02-29',
+    '20201130', '20210229', '2021001', '2021-366', '2020-366',
+    '2021000', '2021-12-8', '1999-04-31', '9999-12-31',
+]
+
+times = [
+    '', '12', '24', '1230', '12:30', '12:60', '123045', '12:30:45',
+    '12:30:60', '-3045', '-6045', '--45', '--60', '2330', '0000',
+    '12:3045', '1230:45',
+]
+
+zones = ['', 'Z', 'z', '+05', '-0530', '+05:30', '+24', '-2359', '+2400']
+
+
+def datetimes():
+    for date, time, zone in itertools.product(dates, times, zones):
+        for sep in ('T', 't', ' '):
+            yield date + sep + time + zone
+
+
+class ValidateTestCase(unittest.TestCase):
+
+    def check_consistent(self, kind, texts):
+        for text in texts:
+            with self.subTest(text=text):
+                result = fd.partialdate.validate(text, kind=kind)
+                value = kind.try_isoparse(text)
+                self.assertEqual(result is None, value is None)
+                self.assertIsNone(
+                    fd.partialdate.validate(text + 'x', kind=kind))
+                btext = text.encode('ascii')
+                self.assertIs(
+                    fd.partialdate.validate(btext, kind=kind), result)
+
+    def test_date_consistent_with_isoparse(self):
+        self.check_consistent(Date, dates)
+
+    def test_time_consistent_with_isoparse(self):
+        self.check_consistent(
+            Time, [time + zone for time in times for zone in zones])
+
+    def test_datetime_consistent_with_isoparse(self):
+        self.check_consistent(Datetime, datetimes())
+
+    def test_date_results(self):
+        for text, date, extended in [
+                ('2021', Precision.YEAR, False),
+                ('2021-12', Precision.YEAR_MONTH, False),
+                ('20211208', Precision.DATE, False),
+                ('2021-12-08', Precision.DATE, True),
+                ('2021342', Precision.DATE, False),
+                ('2021-342', Precision.DATE, True),
+                ('-1208', Precision.MONTH_DAY, False),
+                ('--08', Precision.DAY, False)]:
+            with self.subTest(text=text):
+                self.assertEqual(
+                    fd.partialdate.validate(text, kind=Date),
+                    Validation(date, None, extended))
+
+    def test_time_results(self):
+        for text, time, extended in [
+                ('12', Precision.HOUR, False),
+                ('1230', Precision.HOUR_MINUTE, False),
+                ('12:30', Precision.HOUR_MINUTE, True),
+                ('123045Z', Precision.TIME, False),
+                ('12:30:45+05:30', Precision.TIME, True),
+                ('-3045', Precision.MINUTE_SECOND, False),
+                ('--45', Precision.SECOND, False)]:
+            with self.subTest(text=text):
+                self.assertEqual(
+                    fd.partialdate.validate(text, kind=Time),
+                    Validation(None, time, extended))
+
+    def test_datetime_results(self):
+        self.assertEqual(
+            fd.partialdate.validate('2021T12'),
+            Validation(Precision.YEAR, Precision.HOUR, False))
+        self.assertEqual(
+            fd.partialdate.validate('2021-12-08T12:30'),
+            Validation(Precision.DATE, Precision.HOUR_MINUTE, True))
+        self.assertEqual(
+            fd.partialdate.validate('2021342T123045'),
+            Validation(Precision.DATE, Precision.TIME, False))
+        self.assertEqual(
+            fd.partialdate.validate('--08T1230Z', kind=Datetime),
+            Validation(Precision.DAY, Precision.HOUR_MINUTE, False))
+
+    def test_results_are_shared(self):
+        self.assertIs(
+            fd.partialdate.validate('2021-12-08', kind=Date),
+            fd.partialdate.validate('1999-01-01', kind=Date))
+
+    def test_invalid(self):
+        self.assertIsNone(fd.partialdate.validate('junk'))
+        self.assertIsNone(fd.partialdate.validate('2021-13', kind=Date))
+        self.assertIsNone(fd.partialdate.validate('24', kind=Time))
+        self.assertIsNone(fd.partialdate.validate('12+24', kind=Time))
+        self.assertIsNone(fd.partialdate.validate('2021-366T12'))
+
+    def test_subclass_kind(self):
+
+        class MyDate(Date):
+            __slots__ = ()
+
+        self.assertEqual(
+            fd.partialdate.validate('2021', kind=MyDate),
+            Validation(Precision.YEAR, None, False))
+
+    def test_unsupported_kind(self):
+        with self.assertRaises(TypeError):
+            fd.partialdate.validate('2021', kind=str)
@@ -3,7 +3,15 @@ Support for fd.partialdate tests.
 
 """
 
+import gc
+import io
+import itertools
+import pickle
+import unittest.mock
+import weakref
+
 import fd.partialdate.exceptions
+import fd.partialdate.utils
 
 
 class AssertionHelpers:
@@ -15,6 +23,417 @@ class AssertionHelpers:
         return self.assertRaises(fd.partialdate.exceptions.RangeError)
 
 
+class BatchParsingChecks:
+    """Tests for ``isoparse_many``.
+
+    :attr:`valid` and :attr:`invalid` provide sample inputs.
+
+    """
+
+    def test_isoparse_many(self):
+        values = self.factory.isoparse_many(self.valid)
+        self.assertEqual(
+            values, [self.factory.isoparse(text) for text in self.valid])
+        self.assertEqual(self.factory.isoparse_many(iter(())), [])
+
+    def test_isoparse_many_raise(self):
+        with self.assertRaises(ValueError) as cm:
+            self.factory.isoparse_many(self.valid + self.invalid)
+        self.assertEqual(cm.exception.value, self.invalid[0])
+
+    def test_isoparse_many_skip(self):
+        values = self.factory.isoparse_many(
+            self.invalid + self.valid + self.invalid, errors='skip')
+        self.assertEqual(values, self.factory.isoparse_many(self.valid))
+
+    def test_isoparse_many_none(self):
+        values = self.factory.isoparse_many(
+            self.invalid + self.valid, errors='none')
+        self.assertEqual(values[:len(self.invalid)],
+                         [None] * len(self.invalid))
+        self.assertEqual(values[len(self.invalid):],
+                         self.factory.isoparse_many(self.valid))
+
+    def test_isoparse_many_collect(self):
+        values, failures = self.factory.isoparse_many(
+            self.valid + self.invalid, errors='collect')
+        self.assertEqual(values[:len(self.valid)],
+                         self.factory.isoparse_many(self.valid))
+        self.assertEqual(values[len(self.valid):],
+                         [None] * len(self.invalid))
+        self.assertEqual(
+            [index for index, exc in failures],
+            list(range(len(self.valid), len(self.valid + self.invalid))))
+        # The first invalid sample is unparsable; the second is out
+        # of range.
+        self.assertEqual(
+            [exc.__class__ for index, exc in failures],
+            [fd.partialdate.exceptions.ParseError,
+             fd.partialdate.exceptions.RangeError])
+        self.assertEqual(failures[0][1].value, self.invalid[0])
+
+    def test_isoparse_many_no_parse_error(self):
+        # Lenient policies reject syntax errors without creating an
+        # exception.
+        values = [self.invalid[0], self.valid[0]]
+        expected = self.factory.isoparse(self.valid[0])
+        with unittest.mock.patch.object(
+                fd.partialdate.exceptions, 'ParseError',
+                side_effect=AssertionError('exception created')):
+            self.assertEqual(
+                self.factory.isoparse_many(values, errors='skip'),
+                [expected])
+            self.assertEqual(
+                self.factory.isoparse_many(values, errors='none'),
+                [None, expected])
+
+    def test_isoparse_many_non_text(self):
+        values = [self.valid[0], None, float('nan'), self.valid[0]]
+        with self.assertRaises(TypeError):
+            self.factory.isoparse_many(values)
+        expected = self.factory.isoparse(self.valid[0])
+        self.assertEqual(
+            self.factory.isoparse_many(values, errors='skip'),
+            [expected, expected])
+        self.assertEqual(
+            self.factory.isoparse_many(values, errors='none'),
+            [expected, None, None, expected])
+        results, failures = self.factory.isoparse_many(
+            values, errors='collect')
+        self.assertEqual(results, [expected, None, None, expected])
+        self.assertEqual([index for index, exc in failures], [1, 2])
+        self.assertEqual(
+            [exc.__class__ for index, exc in failures], [TypeError] * 2)
+
+    def test_isoparse_many_bad_policy(self):
+        with self.assertRaises(ValueError) as cm:
+            self.factory.isoparse_many(self.valid, errors='ignore')
+        self.assertEqual(str(cm.exception), "unknown error policy: 'ignore'")
+
+
+class TryParsingChecks:
+    """Tests for ``try_isoparse``.
+
+    :attr:`valid` and :attr:`invalid` provide sample inputs.
+
+    """
+
+    def test_try_isoparse(self):
+        for text in self.valid:
+            self.assertEqual(self.factory.try_isoparse(text),
+                             self.factory.isoparse(text))
+            self.assertEqual(self.factory.try_isoparse(text.encode()),
+                             self.factory.isoparse(text))
+        for text in self.invalid:
+            self.assertIsNone(self.factory.try_isoparse(text))
+            self.assertIsNone(self.factory.try_isoparse(text.encode()))
+
+    def test_try_isoparse_default(self):
+        marker = object()
+        for text in self.invalid:
+            self.assertIs(self.factory.try_isoparse(text, marker), marker)
+            self.assertIs(
+                self.factory.try_isoparse(text, default=marker), marker)
+
+    def test_try_isoparse_no_parse_error(self):
+        # Syntax errors are reported without creating an exception.
+        with unittest.mock.patch.object(
+                fd.partialdate.exceptions, 'ParseError',
+                side_effect=AssertionError('exception created')):
+            self.assertIsNone(self.factory.try_isoparse(self.invalid[0]))
+
+    def test_try_isoparse_cached(self):
+        self.factory.set_parse_cache(10)
+        self.addCleanup(self.factory.set_parse_cache, None)
+        value = self.factory.try_isoparse(self.valid[0])
+        self.assertIs(self.factory.try_isoparse(self.valid[0]), value)
+        with unittest.mock.patch.object(
+                fd.partialdate.exceptions, 'ParseError',
+                side_effect=AssertionError('exception created')):
+            self.assertIsNone(self.factory.try_isoparse(self.invalid[0]))
+        # Failures are not cached.
+        self.assertEqual(self.factory.parse_cache_info().currsize, 1)
+
+    def test_try_isoparse_type_error(self):
+        with self.assertRaises(TypeError):
+            self.factory.try_isoparse(42)
+
+
+class BatchFormattingChecks:
+    """Tests for ``isoformat_many`` and ``write_iso``.
+
+    :attr:`valid` provides sample inputs.
+
+    """
+
+    def values(self):
+        return [self.factory.isoparse(text) for text in self.valid]
+
+    def test_isoformat_many(self):
+        values = self.values()
+        self.assertEqual(self.factory.isoformat_many(values),
+                         [value.isoformat() for value in values])
+        self.assertEqual(
+            self.factory.isoformat_many(iter(values), extended=False),
+            [value.isoformat(extended=False) for value in values])
+        self.assertEqual(self.factory.isoformat_many(()), [])
+
+    def test_write_iso_text(self):
+        values = self.values()
+        f = io.StringIO()
+        self.assertEqual(self.factory.write_iso(values, f), len(values))
+        self.assertEqual(
+            f.getvalue(), ''.join(f'{v.isoformat()}\n' for v in values))
+
+    def test_write_iso_binary(self):
+        values = self.values()
+        f = io.BytesIO()
+        self.assertEqual(
+            self.factory.write_iso(values, f, terminator='\r\n',
+                                   extended=False),
+            len(values))
+        self.assertEqual(
+            f.getvalue(),
+            ''.join(f'{v.isoformat(extended=False)}\r\n'
+                    for v in values).encode())
+
+    def test_write_iso_batches(self):
+        values = self.values() * 3
+        f = unittest.mock.Mock(spec=io.StringIO)
+        with unittest.mock.patch.object(
+                fd.partialdate.utils, 'write_batch_size', 2):
+            self.assertEqual(self.factory.write_iso(values, f), len(values))
+        self.assertEqual(f.write.call_count, (len(values) + 1) // 2)
+        self.assertEqual(
+            ''.join(call[0][0] for call in f.write.call_args_list),
+            ''.join(f'{v.isoformat()}\n' for v in values))
+
+    def test_write_iso_partial_writes(self):
+
+        class Trickle(io.RawIOBase):
+            # Accepts at most three bytes for each write.
+
+            def __init__(self):
+                self.data = b''
+
+            def writable(self):
+                return True
+
+            def write(self, b):
+                self.data += bytes(b[:3])
+                return len(b[:3])
+
+        values = self.values()
+        f = Trickle()
+        self.factory.write_iso(values, f)
+        self.assertEqual(
+            f.data, ''.join(f'{v.isoformat()}\n' for v in values).encode())
+
+    def test_write_iso_would_block(self):
+
+        class Blocked(io.RawIOBase):
+            # Accepts three bytes, then reports that writing would block.
+
+            def __init__(self):
+                self.data = b''
+
+            def writable(self):
+                return True
+
+            def write(self, b):
+                if self.data:
+                    return None
+                self.data = bytes(b[:3])
+                return 3
+
+        f = Blocked()
+        with self.assertRaises(BlockingIOError) as cm:
+            self.factory.write_iso(self.values(), f)
+        self.assertEqual(cm.exception.characters_written, 3)
+
+    def test_write_iso_empty(self):
+        f = unittest.mock.Mock(spec=io.StringIO)
+        self.assertEqual(self.factory.write_iso(iter(()), f), 0)
+        f.write.assert_not_called()
+
+
+class ParseCacheChecks:
+    """Tests for the optional ``isoparse`` cache."""
+
+    def enable_cache(self, maxsize):
+        self.factory.set_parse_cache(maxsize)
+        self.addCleanup(self.factory.set_parse_cache, None)
+
+    def test_parse_cache_disabled(self):
+        self.assertIsNone(self.factory.parse_cache_info())
+        text = self.valid[0]
+        self.assertIsNot(self.factory.isoparse(text),
+                         self.factory.isoparse(text))
+        # Clearing a disabled cache is harmless.
+        self.factory.parse_cache_clear()
+
+    def test_parse_cache_hits(self):
+        self.enable_cache(10)
+        text = self.valid[0]
+        value = self.factory.isoparse(text)
+        self.assertIs(self.factory.isoparse(text), value)
+        self.assertIs(self.factory.isoparse(text.encode()),
+                      self.factory.isoparse(memoryview(text.encode())))
+        info = self.factory.parse_cache_info()
+        self.assertEqual(info, (2, 2, 0, 10, 2))
+        self.assertEqual(info.hits, 2)
+        self.assertEqual(info.misses, 2)
+        self.assertEqual(info.currsize, 2)
+
+    def test_parse_cache_evictions(self):
+        self.enable_cache(2)
+        first = self.factory.isoparse(self.valid[0])
+        self.factory.isoparse(self.valid[1])
+        # Using the first value makes the second least recently used.
+        self.assertIs(self.factory.isoparse(self.valid[0]), first)
+        self.factory.isoparse(self.valid[2])
+        self.assertEqual(self.factory.parse_cache_info(), (1, 3, 1, 2, 2))
+        self.assertIs(self.factory.isoparse(self.valid[0]), first)
+
+    def test_parse_cache_errors(self):
+        self.enable_cache(10)
+        for i in range(2):
+            with self.assertRaises(ValueError):
+                self.factory.isoparse(self.invalid[0])
+        self.assertEqual(self.factory.parse_cache_info().currsize, 0)
+
+    def test_parse_cache_clear(self):
+        self.enable_cache(10)
+        value = self.factory.isoparse(self.valid[0])
+        self.factory.parse_cache_clear()
+        self.assertEqual(self.factory.parse_cache_info(), (0, 0, 0, 10, 0))
+        self.assertIsNot(self.factory.isoparse(self.valid[0]), value)
+
+    def test_parse_cache_subclass(self):
+        self.enable_cache(10)
+
+        class Subclass(self.factory):
+            __slots__ = ()
+
+        self.factory.isoparse(self.valid[0])
+        value = Subclass.isoparse(self.valid[0])
+        self.assertIsInstance(value, Subclass)
+        self.assertIsNone(Subclass.parse_cache_info())
+
+    def test_parse_cache_negative_size(self):
+        with self.assertRaises(ValueError) as cm:
+            self.factory.set_parse_cache(-1)
+        self.assertEqual(str(cm.exception),
+                         'cache size must not be negative: -1')
+
+
+class InterningChecks:
+    """Tests for interning of parsed values."""
+
+    def test_isoparse_intern(self):
+        for text in self.valid:
+            value = self.factory.isoparse(text, intern=True)
+            self.assertIs(self.factory.isoparse(text, intern=True), value)
+            self.assertIs(
+                self.factory.isoparse(text.encode(), intern=True), value)
+            self.assertIsNot(self.factory.isoparse(text), value)
+
+    def test_isoparse_intern_cached(self):
+        self.factory.set_parse_cache(10)
+        self.addCleanup(self.factory.set_parse_cache, None)
+        text = self.valid[0]
+        value = self.factory.isoparse(text, intern=True)
+        self.assertIs(self.factory.isoparse(text, intern=True), value)
+
+    def test_intern_weak(self):
+        value = self.factory.isoparse(self.valid[0], intern=True)
+        ref = weakref.ref(value)
+        del value
+        gc.collect()
+        self.assertIsNone(ref())
+
+
+class PicklingChecks:
+    """Tests for pickling of values.
+
+    :attr:`complete` is the text of a complete value, which hashes the
+    same way as the standard library equivalent.
+
+    """
+
+    def test_pickle(self):
+        for text in self.valid + [self.complete]:
+            value = self.factory.isoparse(text)
+            data = pickle.dumps(value)
+            # Cached hashes and text are not part of the pickled state;
+            # hashes of complete values differ between processes.
+            hash(value)
+            value.isoformat()
+            self.assertEqual(pickle.dumps(value), data)
+            copy = pickle.loads(data)
+            self.assertIs(copy.__class__, self.factory)
+            self.assertEqual(copy, value)
+            self.assertEqual(hash(copy), hash(value))
+            self.assertIn(copy, {value})
+            self.assertEqual(copy.isoformat(), value.isoformat())
+
+
+class ParserEngineChecks:
+    """Compare the default parser with the regular expression parser.
+
+    Candidate inputs are built by concatenating up to :attr:`length`
+    strings from :attr:`pieces`.
+
+    """
+
+    length = 3
+
+    def outcome(self, text):
+        try:
+            value = self.factory.isoparse(text)
+        except Exception as e:
+            return e.__class__, e.args
+        else:
+            return repr(value)
+
+    def candidates(self):
+        for n in range(1, self.length + 1):
+            for parts in itertools.product(self.pieces, repeat=n):
+                yield ''.join(parts)
+
+    def test_engines_agree(self):
+        for text in self.candidates():
+            with unittest.mock.patch.object(
+                    self.module, '_parse_fields', self.module._match):
+                expected = self.outcome(text)
+            self.assertEqual(self.outcome(text), expected, repr(text))
+
+    def test_bytes_agree(self):
+        for text in self.candidates():
+            data = text.encode('utf-8')
+            if len(data) == len(text):
+                expected = self.outcome(text)
+            else:
+                # Only ASCII digits are accepted in bytes.
+                expected = (fd.partialdate.exceptions.ParseError,
+                            (self.what, data.decode('ascii',
+                                                    'backslashreplace')))
+            self.assertEqual(self.outcome(data), expected, repr(data))
+            buffer = memoryview(b'\x00' + data + b'\x00')[1:-1]
+            self.assertEqual(self.outcome(buffer), expected, repr(data))
+
+
+class ReferenceEngine:
+    """Run tests using the regular expression parser."""
+
+    def setUp(self):
+        super().setUp()
+        patcher = unittest.mock.patch.object(
+            self.module, '_parse_fields', self.module._match)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+
 class DateRangeChecks:
 
     def test_year_range_check(self):